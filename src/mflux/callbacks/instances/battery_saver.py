@@ -3,8 +3,10 @@ import logging
 import platform
 import re
 import subprocess
+import time
 
 from mflux.callbacks.callback import BeforeLoopCallback
+from mflux.utils.apple_silicon import AppleSiliconUtil
 from mflux.utils.exceptions import StopImageGenerationException
 
 logger = logging.getLogger(__name__)
@@ -13,12 +15,17 @@ logger = logging.getLogger(__name__)
 class BatterySaver(BeforeLoopCallback):
     PMSET_AC_POWER_STATUS = "Now drawing from 'AC Power'"
     PMSET_BATT_STATUS_PATTERN = r"InternalBattery-.+?(\d+)%"
+    BATTERY_READING_TTL_SECONDS = 30.0
+    MACHINE_MODEL_SYSCTL = "hw.model"
+    # A stalled pmset/system_profiler must not hold up generation; treat it like an unreadable probe
+    PROBE_TIMEOUT_SECONDS = 5.0
 
     _machine_model: str | None = None
     _is_battery_powered: bool | None = None
 
     def __init__(self, battery_percentage_stop_limit: int = 10):
         self.limit = battery_percentage_stop_limit
+        self._last_reading: tuple[float, int | None] | None = None
 
     def call_before_loop(self, **kwargs) -> None:  # type: ignore
         current_pct = self._get_battery_percentage()
@@ -26,6 +33,15 @@ class BatterySaver(BeforeLoopCallback):
             raise StopImageGenerationException(f"Battery below {self.limit}% threshold: {current_pct}%")
 
     def _get_battery_percentage(self) -> int | None:
+        # Batch runs call this before every image; reuse a recent pmset reading instead of forking each time
+        now = time.monotonic()
+        if self._last_reading is not None and now - self._last_reading[0] < self.BATTERY_READING_TTL_SECONDS:
+            return self._last_reading[1]
+        percentage = self._read_battery_percentage()
+        self._last_reading = (now, percentage)
+        return percentage
+
+    def _read_battery_percentage(self) -> int | None:
         if platform.uname().system != "Darwin":
             return None
 
@@ -39,11 +55,12 @@ class BatterySaver(BeforeLoopCallback):
                 capture_output=True,
                 text=True,
                 check=True,
+                timeout=self.PROBE_TIMEOUT_SECONDS,
             )
             if self.PMSET_AC_POWER_STATUS not in result.stdout:
                 if match := re.search(self.PMSET_BATT_STATUS_PATTERN, result.stdout):
                     percentage = int(match.group(1))
-        except (subprocess.CalledProcessError, TypeError) as e:
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, TypeError) as e:
             logger.warning(
                 f"Cannot read battery percentage via 'pmset -g batt': {e}. "
                 f"Battery saver functionality is disabled and the program will continue running."
@@ -60,6 +77,9 @@ class BatterySaver(BeforeLoopCallback):
 
     @classmethod
     def _get_machine_model(cls) -> str:
+        if cls._machine_model is None:
+            # hw.model is the same identifier system_profiler reports as machine_model, without the slow fork
+            cls._machine_model = AppleSiliconUtil.read_sysctl_string(cls.MACHINE_MODEL_SYSCTL) or None
         if cls._machine_model is None:
             try:
                 result = subprocess.run(
@@ -67,11 +87,13 @@ class BatterySaver(BeforeLoopCallback):
                     capture_output=True,
                     text=True,
                     check=True,
+                    timeout=cls.PROBE_TIMEOUT_SECONDS,
                 )
                 data = json.loads(result.stdout)
                 cls._machine_model = data["SPHardwareDataType"][0]["machine_model"]
             except (
                 subprocess.CalledProcessError,
+                subprocess.TimeoutExpired,
                 json.JSONDecodeError,
                 FileNotFoundError,
                 IndexError,
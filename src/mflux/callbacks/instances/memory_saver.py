@@ -2,14 +2,23 @@ import gc
 
 import mlx.core as mx
 import PIL.Image
-from tqdm import tqdm
 
-from mflux.callbacks.callback import AfterLoopCallback, BeforeLoopCallback, InLoopCallback
+from mflux.callbacks.callback import AfterLoopCallback, BeforeLoopCallback
 from mflux.models.common.config.config import Config
 from mflux.models.common.vae.tiling_config import TilingConfig
 
 
-class MemorySaver(BeforeLoopCallback, InLoopCallback, AfterLoopCallback):
+class MemorySaver(BeforeLoopCallback, AfterLoopCallback):
+    TEXT_ENCODER_ATTRIBUTES = (
+        "clip_text_encoder",
+        "t5_text_encoder",
+        "text_encoder",
+        "image_encoder",
+        "image_embedder",
+        "depth_pro",
+        "qwen_vl_encoder",
+    )
+
     def __init__(
         self,
         model,
@@ -46,17 +55,6 @@ class MemorySaver(BeforeLoopCallback, InLoopCallback, AfterLoopCallback):
         if self._num_seeds <= 1 or has_cached_embeds:
             self._delete_text_encoders()
 
-    def call_in_loop(
-        self,
-        t: int,
-        seed: int,
-        prompt: str,
-        latents: mx.array,
-        config: Config,
-        time_steps: tqdm,
-    ) -> None:
-        self.peak_memory = mx.get_peak_memory()
-
     def call_after_loop(
         self,
         seed: int,
@@ -75,25 +73,20 @@ class MemorySaver(BeforeLoopCallback, InLoopCallback, AfterLoopCallback):
 
     def _delete_text_encoders(self) -> None:
         # repeated image generation only works with the same prompt (cache)
-        if hasattr(self.model, "clip_text_encoder"):
-            self.model.clip_text_encoder = None
-        if hasattr(self.model, "t5_text_encoder"):
-            self.model.t5_text_encoder = None
-        if hasattr(self.model, "text_encoder") and self.model.text_encoder is not None:
-            self.model.text_encoder = None
-        if hasattr(self.model, "image_encoder") and self.model.image_encoder is not None:
-            self.model.image_encoder = None
-        if hasattr(self.model, "image_embedder") and self.model.image_embedder is not None:
-            self.model.image_embedder = None
-        if hasattr(self.model, "depth_pro") and self.model.depth_pro is not None:
-            self.model.depth_pro = None
-        if hasattr(self.model, "qwen_vl_encoder") and self.model.qwen_vl_encoder is not None:
-            self.model.qwen_vl_encoder = None
+        released = False
+        for attr in MemorySaver.TEXT_ENCODER_ATTRIBUTES:
+            if getattr(self.model, attr, None) is not None:
+                setattr(self.model, attr, None)
+                released = True
         # Clear VLM tokenizers from the tokenizers dict if present
-        if hasattr(self.model, "tokenizers") and "qwen_vl" in self.model.tokenizers:
-            self.model.tokenizers["qwen_vl"] = None
-        gc.collect()
-        mx.clear_cache()
+        tokenizers = getattr(self.model, "tokenizers", None)
+        if tokenizers is not None and tokenizers.get("qwen_vl") is not None:
+            tokenizers["qwen_vl"] = None
+            released = True
+        # Later seeds find everything already released; skip the full GC sweep then
+        if released:
+            gc.collect()
+            mx.clear_cache()
 
     def _delete_transformer(self) -> None:
         self.model.transformer = None
@@ -249,7 +249,7 @@ class CommandLineParser(argparse.ArgumentParser):
             self.error("--model must be specified when using --path")
 
         if getattr(namespace, "config_from_metadata", False):
-            prior_gen_metadata = json.load(namespace.config_from_metadata.open("rt"))
+            prior_gen_metadata = json.loads(namespace.config_from_metadata.read_bytes())
 
             if hasattr(namespace, "model") and not self._option_was_provided("--model", "-m"):
                 # When --model was not provided explicitly, metadata should win
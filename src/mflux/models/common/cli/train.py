@@ -1,5 +1,4 @@
 from mflux.cli.parser.parsers import CommandLineParser
-from mflux.models.common.training.runner import TrainingRunner
 from mflux.models.common.training.state.training_spec import TrainingSpec
 from mflux.utils.exceptions import StopTrainingException
 
@@ -28,6 +27,9 @@ def main():
         print("✅ Training config validated.")
         return
 
+    # Imported lazily: the model and MLX stack behind the runner dominates import time for --help and --dry-run
+    from mflux.models.common.training.runner import TrainingRunner
+
     try:
         TrainingRunner.train(
             config_path=str(config_path) if config_path is not None else None,
@@ -73,7 +73,7 @@ class LatentCreator:
         tiling_config: "TilingConfig" | None = None,
     ) -> mx.array:
         scaled_user_image = ImageUtil.scale_to_dimensions(
-            image=ImageUtil.load_image(image_path).convert("RGB"),
+            image=ImageUtil.load_image(image_path, draft_size=(width, height)),
             target_width=width,
             target_height=height,
         )
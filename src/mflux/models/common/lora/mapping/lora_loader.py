@@ -1,6 +1,8 @@
+import heapq
 import re
 from collections.abc import Callable
 from dataclasses import dataclass
+from itertools import combinations
 from pathlib import Path
 
 import mlx.core as mx
@@ -12,7 +14,7 @@ from mflux.models.common.lora.mapping.lora_mapping import LoRATarget
 from mflux.models.common.resolution.lora_resolution import LoraResolution
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PatternMatch:
     source_pattern: str
     target_path: str
@@ -29,6 +31,7 @@ class LoRALoader:
         lora_paths: list[str] | None = None,
         lora_scales: list[float] | None = None,
         role: str | None = None,
+        pattern_mappings: list[PatternMatch] | None = None,
     ) -> tuple[list[str], list[float]]:
         resolved_paths = LoraResolution.resolve_paths(lora_paths)
         if not resolved_paths:
@@ -42,8 +45,11 @@ class LoRALoader:
 
         print(f"📦 Loading {len(resolved_paths)} LoRA file(s)...")
 
+        # Build pattern mappings from LoRATargets once, shared by every file (callers may pass a prebuilt table)
+        if pattern_mappings is None:
+            pattern_mappings = LoRALoader._build_pattern_mappings(lora_mapping)
         for lora_file, scale in zip(resolved_paths, resolved_scales):
-            LoRALoader._apply_single_lora(transformer, lora_file, scale, lora_mapping, role=role)
+            LoRALoader._apply_single_lora(transformer, lora_file, scale, pattern_mappings, role=role)
 
         print("✅ All LoRA weights applied successfully")
 
@@ -54,7 +60,7 @@ class LoRALoader:
         transformer: nn.Module,
         lora_file: str,
         scale: float,
-        lora_mapping: list[LoRATarget],
+        pattern_mappings: list[PatternMatch],
         *,
         role: str | None,
     ) -> None:
@@ -71,9 +77,6 @@ class LoRALoader:
             print(f"❌ Failed to load LoRA file: {e}")
             return
 
-        # Build pattern mappings from LoRATargets
-        pattern_mappings = LoRALoader._build_pattern_mappings(lora_mapping)
-
         # Apply LoRA using the mappings (allows multiple targets per source)
         applied_count, matched_keys = LoRALoader._apply_lora_with_mapping(
             transformer, weights, scale, pattern_mappings, role=role
@@ -87,7 +90,8 @@ class LoRALoader:
 
         if unmatched_keys:
             print(f"   ⚠️  {len(unmatched_keys)} unmatched keys in LoRA file:")
-            for key in sorted(unmatched_keys)[:5]:
+            # Only the first five names are shown, so skip sorting every unmatched key
+            for key in heapq.nsmallest(5, unmatched_keys):
                 print(f"      - {key}")
             if len(unmatched_keys) > 5:
                 print(f"      ... and {len(unmatched_keys) - 5} more")
@@ -150,14 +154,10 @@ class LoRALoader:
 
         # For each weight key, find ALL matching patterns (not just first)
         # This allows multiple targets to use the same source (e.g., QKV split)
+        pattern_index = LoRALoader._build_pattern_index(pattern_mappings)
         for weight_key, weight_value in weights.items():
-            for mapping in pattern_mappings:
-                match_result = LoRALoader._match_pattern(weight_key, mapping.source_pattern)
-                if match_result is None:
-                    continue
-
+            for mapping, block_idx in LoRALoader._find_matching_mappings(weight_key, pattern_index):
                 matched_keys.add(weight_key)
-                block_idx = match_result
 
                 # Resolve target path with block index if needed
                 target_path = mapping.target_path
@@ -186,6 +186,48 @@ class LoRALoader:
 
         return applied_count, matched_keys
 
+    @staticmethod
+    def _build_pattern_index(pattern_mappings: list[PatternMatch]) -> dict[str, list[tuple[int, PatternMatch]]]:
+        # Keyed by source pattern; "{block}" patterns stay templated and are looked up per candidate block number
+        pattern_index: dict[str, list[tuple[int, PatternMatch]]] = {}
+        for order, mapping in enumerate(pattern_mappings):
+            pattern_index.setdefault(mapping.source_pattern, []).append((order, mapping))
+        return pattern_index
+
+    @staticmethod
+    def _find_matching_mappings(
+        weight_key: str,
+        pattern_index: dict[str, list[tuple[int, PatternMatch]]],
+    ) -> list[tuple[PatternMatch, int]]:
+        found: dict[int, tuple[PatternMatch, int]] = {}
+        for order, mapping in pattern_index.get(weight_key, ()):
+            found[order] = (mapping, 0)
+
+        # Same semantics as _match_pattern: a "{block}" pattern matches when substituting one of the
+        # numbers in the key reproduces the key, so rebuild the candidate templates from the key instead.
+        number_spans = [(m.span(), m.group()) for m in re.finditer(r"\d+", weight_key)]
+        for num_str in dict.fromkeys(text for _, text in number_spans):
+            block_idx = int(num_str)
+            spans = [span for span, text in number_spans if text == str(block_idx)]
+            for size in range(1, len(spans) + 1):
+                for chosen in combinations(spans, size):
+                    template = LoRALoader._templated_key(weight_key, chosen)
+                    for order, mapping in pattern_index.get(template, ()):
+                        found.setdefault(order, (mapping, block_idx))
+
+        return [found[order] for order in sorted(found)]
+
+    @staticmethod
+    def _templated_key(weight_key: str, spans: tuple[tuple[int, int], ...]) -> str:
+        parts = []
+        cursor = 0
+        for start, end in spans:
+            parts.append(weight_key[cursor:start])
+            parts.append("{block}")
+            cursor = end
+        parts.append(weight_key[cursor:])
+        return "".join(parts)
+
     @staticmethod
     def _match_pattern(weight_key: str, pattern: str) -> int | None:
         if "{block}" in pattern:
@@ -206,12 +248,14 @@ class LoRALoader:
     def _apply_lora_matrices_to_target(
         transformer: nn.Module, target_path: str, lora_data: dict, scale: float, *, role: str | None
     ) -> bool:
-        # Navigate to the target layer
+        # Navigate to the target layer, keeping its parent for the replacement below
         current_module = transformer
+        parent_module = transformer
         path_parts = target_path.split(".")
 
         try:
             for part in path_parts:
+                parent_module = current_module
                 if part.isdigit():
                     current_module = current_module[int(part)]
                 elif isinstance(current_module, dict) and part in current_module:
@@ -284,15 +328,6 @@ class LoRALoader:
                 replacement_layer = lora_layer
 
             # Replace the layer in the parent module
-            parent_module = transformer
-            for part in path_parts[:-1]:
-                if part.isdigit():
-                    parent_module = parent_module[int(part)]
-                elif isinstance(parent_module, dict) and part in parent_module:
-                    parent_module = parent_module[part]
-                else:
-                    parent_module = getattr(parent_module, part)
-
             final_attr = path_parts[-1]
             if final_attr.isdigit():
                 parent_module[int(final_attr)] = replacement_layer
@@ -18,33 +18,44 @@ class ConfigResolution:
             Rule(priority=3, name="error", check="always", action=ConfigAction.ERROR),
         }
     )
+    _ORDERED_RULES = tuple(sorted(RULES, key=lambda r: r.priority))
+    # AVAILABLE_MODELS is fixed at import, so its base models are filtered and sorted only once
+    _base_models: tuple["ModelConfig", ...] | None = None
 
     @staticmethod
     def resolve(model_name: str, base_model: str | None = None) -> "ModelConfig":
-        from mflux.models.common.config.model_config import AVAILABLE_MODELS, ModelConfig
+        from mflux.models.common.config.model_config import ModelConfig
         from mflux.utils.exceptions import InvalidBaseModel, ModelConfigError
 
-        base_models = sorted(
-            [m for m in AVAILABLE_MODELS.values() if m.base_model is None],
-            key=lambda x: x.priority,
-        )
-
         ctx = {
             "model_name": model_name,
             "base_model": base_model,
-            "base_models": base_models,
+            "base_models": ConfigResolution._get_base_models(),
             "ModelConfig": ModelConfig,
             "InvalidBaseModel": InvalidBaseModel,
             "ModelConfigError": ModelConfigError,
         }
 
-        for rule in sorted(ConfigResolution.RULES, key=lambda r: r.priority):
+        for rule in ConfigResolution._ORDERED_RULES:
             if ConfigResolution._check(rule.check, ctx):
                 logger.debug(f"Config resolution: '{model_name}' → rule '{rule.name}' ({rule.action.value})")
                 return ConfigResolution._execute(rule.action, ctx)
 
         raise ValueError(f"No rule matched for model_name: {model_name}")
 
+    @staticmethod
+    def _get_base_models() -> tuple["ModelConfig", ...]:
+        if ConfigResolution._base_models is None:
+            from mflux.models.common.config.model_config import AVAILABLE_MODELS
+
+            ConfigResolution._base_models = tuple(
+                sorted(
+                    (m for m in AVAILABLE_MODELS.values() if m.base_model is None),
+                    key=lambda x: x.priority,
+                )
+            )
+        return ConfigResolution._base_models
+
     @staticmethod
     def _check(check: str, ctx: dict) -> bool:
         if check == "is_exact_match":
@@ -1,11 +1,9 @@
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from huggingface_hub import snapshot_download
-from huggingface_hub.utils import LocalEntryNotFoundError
-
 from mflux.cli.defaults.defaults import MFLUX_LORA_CACHE_DIR
 from mflux.models.common.resolution.actions import LoraAction, Rule
 
@@ -24,12 +22,17 @@ class LoraResolution:
             Rule(priority=6, name="error", check="always", action=LoraAction.ERROR),
         }
     )  # fmt: off
+    _ORDERED_RULES = tuple(sorted(RULES, key=lambda r: r.priority))
 
     _registry: dict[str, Path] = {}
+    # LORA_LIBRARY_PATH is scanned on first registry lookup rather than at import time
+    _registry_loaded = False
+    # HuggingFace-backed paths resolved earlier in this process, so repeat generations skip the cache probes
+    _hf_resolved: dict[str, str] = {}
 
     @staticmethod
     def resolve(path: str) -> str:
-        for rule in sorted(LoraResolution.RULES, key=lambda r: r.priority):
+        for rule in LoraResolution._ORDERED_RULES:
             if LoraResolution._check(rule.check, path):
                 logger.debug(f"LoRA resolution: '{path}' → rule '{rule.name}' ({rule.action.value})")
                 return LoraResolution._execute(rule.action, path)
@@ -101,18 +104,18 @@ class LoraResolution:
         if check == "exists_locally":
             return Path(path).expanduser().exists()
         if check == "in_registry":
+            LoraResolution._ensure_registry()
             return path in LoraResolution._registry
         if check == "is_collection_cached":
             if not LoraResolution._is_collection_format(path):
                 return False
-            repo_id, filename = LoraResolution._split_collection_path(path)
-            return LoraResolution._is_collection_in_cache(repo_id, filename)
+            return LoraResolution._memoized_hf_path(path) is not None or LoraResolution._is_collection_in_cache(path)
         if check == "is_collection_format":
             return LoraResolution._is_collection_format(path)
         if check == "is_repo_cached":
             if not LoraResolution._is_hf_format(path):
                 return False
-            return LoraResolution._is_repo_in_cache(path)
+            return LoraResolution._memoized_hf_path(path) is not None or LoraResolution._is_repo_in_cache(path)
         if check == "is_hf_format":
             return LoraResolution._is_hf_format(path)
         if check == "always":
@@ -120,34 +123,23 @@ class LoraResolution:
         return False
 
     @staticmethod
-    def _is_collection_in_cache(repo_id: str, filename: str) -> bool:
-        cache_path = MFLUX_LORA_CACHE_DIR
-        # Check mflux cache
-        cached_file_path = cache_path / filename
-        if cached_file_path.exists() and cached_file_path.is_file():
-            return True
-        # Check HF cache
+    def _is_collection_in_cache(path: str) -> bool:
+        from huggingface_hub.utils import LocalEntryNotFoundError
+
+        # Resolve the file while probing so the cached action doesn't hit the HF cache a second time
+        repo_id, filename = LoraResolution._split_collection_path(path)
         try:
-            snapshot_download(
-                repo_id=repo_id,
-                allow_patterns=[f"*{filename}*"],
-                cache_dir=str(cache_path),
-                local_files_only=True,
-            )
+            LoraResolution._memoize_hf_path(path, LoraResolution._load_collection_from_cache(repo_id, filename))
             return True
         except LocalEntryNotFoundError:
             return False
 
     @staticmethod
     def _is_repo_in_cache(repo_id: str) -> bool:
-        cache_path = MFLUX_LORA_CACHE_DIR
+        from huggingface_hub.utils import LocalEntryNotFoundError
+
         try:
-            snapshot_download(
-                repo_id=repo_id,
-                allow_patterns=["*.safetensors"],
-                cache_dir=str(cache_path),
-                local_files_only=True,
-            )
+            LoraResolution._memoize_hf_path(repo_id, LoraResolution._load_repo_from_cache(repo_id))
             return True
         except LocalEntryNotFoundError:
             return False
@@ -159,23 +151,43 @@ class LoraResolution:
         if action == LoraAction.REGISTRY:
             return str(LoraResolution._registry[path])
         if action == LoraAction.HUGGINGFACE_COLLECTION_CACHED:
+            if (memoized := LoraResolution._memoized_hf_path(path)) is not None:
+                return memoized
             repo_id, filename = LoraResolution._split_collection_path(path)
-            return LoraResolution._load_collection_from_cache(repo_id, filename)
+            return LoraResolution._memoize_hf_path(path, LoraResolution._load_collection_from_cache(repo_id, filename))
         if action == LoraAction.HUGGINGFACE_COLLECTION:
             repo_id, filename = LoraResolution._split_collection_path(path)
-            return LoraResolution._download_collection(repo_id, filename)
+            return LoraResolution._memoize_hf_path(path, LoraResolution._download_collection(repo_id, filename))
         if action == LoraAction.HUGGINGFACE_REPO_CACHED:
-            return LoraResolution._load_repo_from_cache(path)
+            if (memoized := LoraResolution._memoized_hf_path(path)) is not None:
+                return memoized
+            return LoraResolution._memoize_hf_path(path, LoraResolution._load_repo_from_cache(path))
         if action == LoraAction.HUGGINGFACE_REPO:
-            return LoraResolution._download_repo(path)
+            return LoraResolution._memoize_hf_path(path, LoraResolution._download_repo(path))
         if action == LoraAction.ERROR:
             raise FileNotFoundError(
                 f"LoRA file not found: '{path}'. File does not exist and is not in the LoRA library."
             )
         raise ValueError(f"Unknown action: {action}")
 
+    @staticmethod
+    def _memoized_hf_path(path: str) -> str | None:
+        resolved = LoraResolution._hf_resolved.get(path)
+        if resolved is not None and not Path(resolved).is_file():
+            # The cached file was removed since it was resolved; probe again
+            del LoraResolution._hf_resolved[path]
+            return None
+        return resolved
+
+    @staticmethod
+    def _memoize_hf_path(path: str, resolved: str) -> str:
+        LoraResolution._hf_resolved[path] = resolved
+        return resolved
+
     @staticmethod
     def _load_repo_from_cache(repo_id: str) -> str:
+        from huggingface_hub import snapshot_download
+
         cache_path = MFLUX_LORA_CACHE_DIR
         cache_path.mkdir(parents=True, exist_ok=True)
 
@@ -203,6 +215,8 @@ class LoraResolution:
 
     @staticmethod
     def _download_repo(repo_id: str) -> str:
+        from huggingface_hub import snapshot_download
+
         cache_path = MFLUX_LORA_CACHE_DIR
         cache_path.mkdir(parents=True, exist_ok=True)
 
@@ -230,19 +244,15 @@ class LoraResolution:
 
     @staticmethod
     def _load_collection_from_cache(repo_id: str, filename: str) -> str:
+        from huggingface_hub import snapshot_download
+
         cache_path = MFLUX_LORA_CACHE_DIR
         cache_path.mkdir(parents=True, exist_ok=True)
 
-        # Check mflux cache first
+        # Check mflux cache first; is_file() follows links, so a dangling one falls through to the HF cache
         cached_file_path = cache_path / filename
-        if cached_file_path.exists() and cached_file_path.is_file():
-            try:
-                with open(cached_file_path, "rb") as f:
-                    f.read(1)
-                return str(cached_file_path)
-            except (OSError, IOError):
-                # File corrupted, fall through to HF cache
-                pass
+        if cached_file_path.is_file():
+            return str(cached_file_path)
 
         # Load from HF cache
         download_path = Path(
@@ -258,6 +268,8 @@ class LoraResolution:
 
     @staticmethod
     def _download_collection(repo_id: str, filename: str) -> str:
+        from huggingface_hub import snapshot_download
+
         cache_path = MFLUX_LORA_CACHE_DIR
         cache_path.mkdir(parents=True, exist_ok=True)
 
@@ -286,8 +298,11 @@ class LoraResolution:
                 if not target_path.exists():
                     try:
                         target_path.symlink_to(file)
+                    except FileExistsError:
+                        # Another process sharing the cache linked it first
+                        pass
                     except (OSError, AttributeError):
-                        shutil.copy2(file, target_path)
+                        LoraResolution._hardlink_or_copy(file, target_path)
 
                 return str(target_path)
 
@@ -295,19 +310,16 @@ class LoraResolution:
 
     @staticmethod
     def get_registry() -> dict[str, Path]:
+        LoraResolution._ensure_registry()
         return LoraResolution._registry.copy()
 
     @staticmethod
     def discover_files(library_paths: list[Path]) -> dict[str, Path]:
         lora_files = {}
-        for library_path in reversed(library_paths):
-            if not library_path.exists() or not library_path.is_dir():
-                continue
-            for safetensor_path in library_path.rglob("*.safetensors"):
-                basename = safetensor_path.stem
-                if basename.isdigit() and safetensor_path.parent.name == "transformer":
-                    continue
-                lora_files[basename] = safetensor_path.resolve()
+        # Library trees are walked concurrently; map() keeps the earlier-path-wins precedence intact
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(library_paths)))) as pool:
+            for library_files in pool.map(LoraResolution._discover_library_files, reversed(library_paths)):
+                lora_files.update(library_files)
         return lora_files
 
     @staticmethod
@@ -316,6 +328,32 @@ class LoraResolution:
         if library_path_env:
             library_paths = [Path(p.strip()) for p in library_path_env.split(":") if p.strip()]
             LoraResolution._registry = LoraResolution.discover_files(library_paths)
+        LoraResolution._registry_loaded = True
+        LoraResolution._hf_resolved.clear()
+
+    @staticmethod
+    def _ensure_registry() -> None:
+        if not LoraResolution._registry_loaded:
+            LoraResolution._initialize_registry()
 
+    @staticmethod
+    def _hardlink_or_copy(source: Path, target_path: Path) -> None:
+        # Where symlinks are unavailable, a hardlink still avoids copying a multi-GB file
+        try:
+            os.link(source.resolve(), target_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            shutil.copy2(source, target_path)
 
-LoraResolution._initialize_registry()
+    @staticmethod
+    def _discover_library_files(library_path: Path) -> dict[str, Path]:
+        lora_files = {}
+        if not library_path.exists() or not library_path.is_dir():
+            return lora_files
+        for safetensor_path in library_path.rglob("*.safetensors"):
+            basename = safetensor_path.stem
+            if basename.isdigit() and safetensor_path.parent.name == "transformer":
+                continue
+            lora_files[basename] = safetensor_path.resolve()
+        return lora_files
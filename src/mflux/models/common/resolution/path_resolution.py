@@ -2,7 +2,6 @@ import logging
 import os
 from pathlib import Path
 
-from huggingface_hub import snapshot_download
 from huggingface_hub.constants import HF_HUB_CACHE
 
 from mflux.models.common.resolution.actions import PathAction, Rule
@@ -20,13 +19,14 @@ class PathResolution:
             Rule(priority=4, name="error", check="always", action=PathAction.ERROR),
         }
     )
+    _ORDERED_RULES = tuple(sorted(RULES, key=lambda r: r.priority))
 
     @staticmethod
     def resolve(path: str | None, patterns: list[str] | None = None) -> Path | None:
         if patterns is None:
             patterns = ["*.safetensors"]
 
-        for rule in sorted(PathResolution.RULES, key=lambda r: r.priority):
+        for rule in PathResolution._ORDERED_RULES:
             if PathResolution._check(rule.check, path, patterns):
                 logger.debug(f"Path resolution: '{path}' → rule '{rule.name}' ({rule.action.value})")
                 return PathResolution._execute(rule.action, path, patterns)
@@ -49,7 +49,8 @@ class PathResolution:
                 return False
             # Warn if directory exists but contains no matching files
             if local_path.is_dir():
-                has_matching_files = any(list(local_path.glob(p)) for p in patterns)
+                # Stop at the first match instead of materializing the whole listing
+                has_matching_files = any(next(local_path.glob(p), None) is not None for p in patterns)
                 if not has_matching_files:
                     print(
                         f"⚠️  Directory '{path}' exists but contains no files matching {patterns}. "
@@ -76,9 +77,14 @@ class PathResolution:
             cached_path = PathResolution._find_complete_cached_snapshot(path, patterns)
             if cached_path:
                 return cached_path
+            # Imported lazily: huggingface_hub's download stack dominates CLI import time
+            from huggingface_hub import snapshot_download
+
             # Fallback to standard snapshot_download (shouldn't happen if _check passed)
             return Path(snapshot_download(repo_id=path, allow_patterns=patterns, local_files_only=True))
         if action == PathAction.HUGGINGFACE:
+            from huggingface_hub import snapshot_download
+
             print(f"Downloading model from HuggingFace: {path}...")
             return Path(snapshot_download(repo_id=path, allow_patterns=patterns))
         if action == PathAction.ERROR:
@@ -140,13 +146,10 @@ class PathResolution:
             # No specific subdirs required - check that all patterns are satisfied
             if patterns:
                 for pattern in patterns:
-                    # Check if this specific pattern has any matches
-                    matches = list(snapshot_path.glob(pattern))
-                    if not matches:
-                        return False
-                    # Verify at least one match actually exists (handles broken symlinks)
+                    # Walk the matches lazily and stop at the first one that actually exists
+                    # (handles broken symlinks); no match at all also fails the pattern
                     has_valid_match = False
-                    for match in matches:
+                    for match in snapshot_path.glob(pattern):
                         if match.is_symlink():
                             if os.path.exists(match):
                                 has_valid_match = True
@@ -14,10 +14,11 @@ class QuantizationResolution:
             Rule(priority=3, name="conflict", check="any_any", action=QuantizationAction.STORED),
         }
     )
+    _ORDERED_RULES = tuple(sorted(RULES, key=lambda r: r.priority))
 
     @staticmethod
     def resolve(stored: int | None, requested: int | None) -> tuple[int | None, str | None]:
-        for rule in sorted(QuantizationResolution.RULES, key=lambda r: r.priority):
+        for rule in QuantizationResolution._ORDERED_RULES:
             if QuantizationResolution._check(rule.check, stored, requested):
                 logger.debug(
                     f"Quantization resolution: stored={stored}, requested={requested} "
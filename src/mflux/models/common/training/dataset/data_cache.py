@@ -87,10 +87,13 @@ class TrainingDataCache:
     @staticmethod
     def load_tensors(*, paths: CachePaths, data_id: int) -> tuple[mx.array, Any, int, int]:
         tensor_path = paths.data / f"{data_id:07d}.safetensors"
-        if not tensor_path.exists():
-            raise FileNotFoundError(f"Cached data item not found: {tensor_path}")
-
-        tensors, metadata = mx.load(str(tensor_path), return_metadata=True)
+        # Loaded for every item of every low-RAM step: stat the file only when the load itself fails
+        try:
+            tensors, metadata = mx.load(str(tensor_path), return_metadata=True)
+        except RuntimeError as e:
+            if not tensor_path.exists():
+                raise FileNotFoundError(f"Cached data item not found: {tensor_path}") from e
+            raise
         schema = metadata.get("mflux_cache_schema")
         if schema is None:
             raise ValueError(
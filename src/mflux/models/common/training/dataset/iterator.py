@@ -117,10 +117,9 @@ class Iterator:
 
     @classmethod
     def from_json(cls, training_spec: TrainingSpec, iterator_path: str, dataset: Dataset) -> "Iterator":
-        data = ZipUtil.unzip(
+        data = ZipUtil.read_json(
             zip_path=training_spec.checkpoint_path,
             filename=iterator_path,
-            loader=lambda x: json.load(open(x, "r")),
         )
         if "seed" not in data:
             data["seed"] = training_spec.seed
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from mflux.models.common.training.state.training_spec import BlockRange, LoraTargetSpec
 
 
-def _iter_parts(path: str) -> list[str]:
-    parts = [p for p in path.split(".") if p]
+@lru_cache(maxsize=4096)
+def _iter_parts(path: str) -> tuple[str, ...]:
+    # The same module paths are resolved at injection and again at every checkpoint save
+    parts = tuple(p for p in path.split(".") if p)
     if not parts:
         raise ValueError("module_path cannot be empty")
     return parts
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import gc
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import mlx.core as mx
@@ -16,7 +18,7 @@ from mflux.models.common.training.dataset.disk_backed_data import DiskBackedData
 from mflux.models.common.training.dataset.iterator import Iterator
 from mflux.models.common.training.lora.target_injector import inject_lora_targets
 from mflux.models.common.training.optimization.optimizer import Optimizer
-from mflux.models.common.training.state.training_spec import TrainingSpec
+from mflux.models.common.training.state.training_spec import DataSpec, TrainingSpec
 from mflux.models.common.training.state.training_state import TrainingState
 from mflux.models.common.training.state.zip_util import ZipUtil
 from mflux.models.common.training.statistics.statistics import Statistics
@@ -53,6 +55,25 @@ class TrainingRunner:
             error_template=f"Image too small for training (needs >=16px): {image_path} ({{width}}x{{height}})",
         )
 
+    @staticmethod
+    def _probe_data_item(*, training_spec: TrainingSpec, item: DataSpec) -> tuple[int, int]:
+        if item.input_image is not None:
+            # Only the header is read: an unreadable edit input should fail here, not midway through encoding.
+            with PILImage.open(item.input_image.resolve()):
+                pass
+        return TrainingRunner._resolve_data_dimensions(training_spec=training_spec, image_path=item.image)
+
+    @staticmethod
+    def _resolve_all_data_dimensions(training_spec: TrainingSpec) -> list[tuple[int, int]]:
+        # Header probes are I/O bound; run them concurrently and fail fast before any encoding starts.
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            return list(
+                pool.map(
+                    lambda item: TrainingRunner._probe_data_item(training_spec=training_spec, item=item),
+                    training_spec.data,
+                )
+            )
+
     @staticmethod
     def train(*, config_path: str | None, resume_path: str | None) -> tuple[TrainingAdapter, TrainingSpec]:
         training_spec = TrainingSpec.resolve(config_path=config_path, resume_path=resume_path)
@@ -126,10 +147,8 @@ class TrainingRunner:
             if training_spec.data_root is None:
                 raise ValueError("low_ram requires TrainingSpec.data_root to be set")
             cache_paths = TrainingDataCache.wipe_and_init(data_root=Path(training_spec.data_root))
-            for i, item in enumerate(training_spec.data):
-                width, height = TrainingRunner._resolve_data_dimensions(
-                    training_spec=training_spec, image_path=item.image
-                )
+            dimensions = TrainingRunner._resolve_all_data_dimensions(training_spec)
+            for i, (item, (width, height)) in enumerate(zip(training_spec.data, dimensions)):
                 clean_latents, cond = adapter.encode_data(
                     data_id=i,
                     image_path=item.image,
@@ -156,10 +175,8 @@ class TrainingRunner:
         else:
             # Encode dataset data (deterministic, upfront)
             encoded_data: list[DataItem] = []
-            for i, item in enumerate(training_spec.data):
-                width, height = TrainingRunner._resolve_data_dimensions(
-                    training_spec=training_spec, image_path=item.image
-                )
+            dimensions = TrainingRunner._resolve_all_data_dimensions(training_spec)
+            for i, (item, (width, height)) in enumerate(zip(training_spec.data, dimensions)):
                 clean_latents, cond = adapter.encode_data(
                     data_id=i,
                     image_path=item.image,
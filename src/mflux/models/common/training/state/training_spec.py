@@ -3,11 +3,26 @@ import json
 import os
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 from mflux.models.common.training.state.zip_util import ZipUtil
 
 TRAINING_FILE_NAME_RUN_MANIFEST = "run.json"
+TRAINING_DATA_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+TRAINING_DATA_PROMPT_SUFFIX = ".txt"
+TRAINING_DATA_EDIT_INPUT_SUFFIX = "_in"
+TRAINING_DATA_EDIT_OUTPUT_SUFFIX = "_out"
+# Monitoring keys from older configs, each with the error that points at its replacement (checked in order)
+TRAINING_MONITORING_REMOVED_KEYS = (
+    ("validation_prompt", "Monitoring no longer accepts 'validation_prompt'. Use data/preview*.txt."),
+    ("validation_prompt_file", "Monitoring no longer accepts 'validation_prompt_file'. Use data/preview*.txt."),
+    ("validation_image", "Monitoring no longer accepts 'validation_image'. Use data/preview.* instead."),
+    ("preview_prompt", "Monitoring no longer accepts 'preview_prompt'. Use data/preview*.txt."),
+    ("preview_prompt_file", "Monitoring no longer accepts 'preview_prompt_file'. Use data/preview*.txt."),
+    ("preview_image", "Monitoring no longer accepts 'preview_image'. Use data/preview.* instead."),
+    ("validation_width", "Monitoring uses 'preview_width'/'preview_height'."),
+    ("validation_height", "Monitoring uses 'preview_width'/'preview_height'."),
+)
 
 
 @dataclass
@@ -143,34 +158,9 @@ class MonitoringSpec:
         preview_prompts: list[str],
         preview_prompt_names: list[str],
     ) -> "MonitoringSpec":
-        has_validation_prompt = "validation_prompt" in param and param["validation_prompt"] is not None
-        if has_validation_prompt:
-            raise ValueError("Monitoring no longer accepts 'validation_prompt'. Use data/preview*.txt.")
-
-        has_validation_prompt_file = "validation_prompt_file" in param and param["validation_prompt_file"] is not None
-        if has_validation_prompt_file:
-            raise ValueError("Monitoring no longer accepts 'validation_prompt_file'. Use data/preview*.txt.")
-
-        has_validation_image = "validation_image" in param and param["validation_image"] is not None
-        if has_validation_image:
-            raise ValueError("Monitoring no longer accepts 'validation_image'. Use data/preview.* instead.")
-
-        has_preview_prompt = "preview_prompt" in param and param["preview_prompt"] is not None
-        if has_preview_prompt:
-            raise ValueError("Monitoring no longer accepts 'preview_prompt'. Use data/preview*.txt.")
-
-        has_preview_prompt_file = "preview_prompt_file" in param and param["preview_prompt_file"] is not None
-        if has_preview_prompt_file:
-            raise ValueError("Monitoring no longer accepts 'preview_prompt_file'. Use data/preview*.txt.")
-
-        has_preview_image = "preview_image" in param and param["preview_image"] is not None
-        if has_preview_image:
-            raise ValueError("Monitoring no longer accepts 'preview_image'. Use data/preview.* instead.")
-
-        has_validation_width = "validation_width" in param and param["validation_width"] is not None
-        has_validation_height = "validation_height" in param and param["validation_height"] is not None
-        if has_validation_width or has_validation_height:
-            raise ValueError("Monitoring uses 'preview_width'/'preview_height'.")
+        for key, message in TRAINING_MONITORING_REMOVED_KEYS:
+            if param.get(key) is not None:
+                raise ValueError(message)
 
         if not preview_prompts:
             raise ValueError("Monitoring requires at least one data/preview*.txt.")
@@ -245,8 +235,8 @@ class TrainingSpec:
 
     @staticmethod
     def _from_config(path: str, new_folder: bool = True, *, create_output_dir: bool = True) -> "TrainingSpec":
-        with open(Path(path), "r") as f:
-            data = json.load(f)
+        # One read and one parse; json.loads detects the UTF-8/16/32 encoding from the raw bytes
+        data = json.loads(Path(path).read_bytes())
         return TrainingSpec.from_conf(data, path, new_folder, create_output_dir=create_output_dir)
 
     @staticmethod
@@ -266,6 +256,58 @@ class TrainingSpec:
         if max_resolution is not None and max_resolution <= 0:
             raise ValueError("'max_resolution' must be > 0")
 
+        # Validate the plain config fields before any data folder scan or prompt file read
+        training_loop_conf = config["training_loop"].copy()
+
+        timestep_low = int(training_loop_conf.get("timestep_low", 0))
+        timestep_high_raw = training_loop_conf.get("timestep_high", None)
+        timestep_high = None if timestep_high_raw is None else int(timestep_high_raw)
+        resolved_timestep_high = steps if timestep_high is None else timestep_high
+
+        if timestep_low < 0:
+            raise ValueError("'timestep_low' must be >= 0")
+        if resolved_timestep_high <= 0:
+            raise ValueError("'timestep_high' must be > 0")
+        if timestep_low >= resolved_timestep_high:
+            raise ValueError("'timestep_low' must be < 'timestep_high'")
+        if resolved_timestep_high > steps:
+            raise ValueError("'timestep_high' must be <= 'steps'")
+
+        training_loop = TrainingLoopSpec(**training_loop_conf)
+        optimizer = OptimizerSpec(**config["optimizer"])
+
+        checkpoint_conf = config["checkpoint"]
+        save_frequency = int(checkpoint_conf["save_frequency"])
+        if save_frequency <= 0:
+            raise ValueError("Checkpoint save_frequency must be > 0")
+        # The output folder is only created once the whole config has validated (see below)
+        checkpoint = CheckpointSpec(
+            save_frequency=save_frequency,
+            output_path=TrainingSpec._resolve_output_path(
+                checkpoint_conf["output_path"], new_folder, create_output_dir=False
+            ),
+        )
+
+        # Parse LoRA configuration
+        targets: list[LoraTargetSpec] = []
+
+        lora_conf = config.get("lora_layers", None) or {}
+        if "targets" not in lora_conf:
+            raise ValueError("Config must include lora_layers.targets[]")
+        for t in lora_conf["targets"]:
+            blocks = None
+            if t.get("blocks") is not None:
+                blocks = BlockRange(**t["blocks"])
+            targets.append(
+                LoraTargetSpec(
+                    module_path=t["module_path"],
+                    rank=t["rank"],
+                    blocks=blocks,
+                )
+            )
+
+        lora_layers = LoraLayersSpec(targets=targets)
+
         data_conf = config["data"]
         if isinstance(data_conf, str):
             absolute_or_relative_path = data_conf
@@ -308,36 +350,6 @@ class TrainingSpec:
         )
         is_edit = any(item.input_image is not None for item in data)
 
-        training_loop_conf = config["training_loop"].copy()
-
-        timestep_low = int(training_loop_conf.get("timestep_low", 0))
-        timestep_high_raw = training_loop_conf.get("timestep_high", None)
-        timestep_high = None if timestep_high_raw is None else int(timestep_high_raw)
-        resolved_timestep_high = steps if timestep_high is None else timestep_high
-
-        if timestep_low < 0:
-            raise ValueError("'timestep_low' must be >= 0")
-        if resolved_timestep_high <= 0:
-            raise ValueError("'timestep_high' must be > 0")
-        if timestep_low >= resolved_timestep_high:
-            raise ValueError("'timestep_low' must be < 'timestep_high'")
-        if resolved_timestep_high > steps:
-            raise ValueError("'timestep_high' must be <= 'steps'")
-
-        training_loop = TrainingLoopSpec(**training_loop_conf)
-        optimizer = OptimizerSpec(**config["optimizer"])
-
-        checkpoint_conf = config["checkpoint"]
-        save_frequency = int(checkpoint_conf["save_frequency"])
-        if save_frequency <= 0:
-            raise ValueError("Checkpoint save_frequency must be > 0")
-        checkpoint = CheckpointSpec(
-            save_frequency=save_frequency,
-            output_path=TrainingSpec._resolve_output_path(
-                checkpoint_conf["output_path"], new_folder, create_output_dir=create_output_dir
-            ),
-        )
-
         # Track whether we're using fallback prompts (for edit training preview image logic)
         using_fallback_prompts = False
         if monitoring_conf is not None and not preview_prompts:
@@ -358,26 +370,6 @@ class TrainingSpec:
         # Statistics are always tracked (no config needed)
         statistics = StatisticsSpec()
 
-        # Parse LoRA configuration
-        targets: list[LoraTargetSpec] = []
-
-        lora_conf = config.get("lora_layers", None) or {}
-        if "targets" not in lora_conf:
-            raise ValueError("Config must include lora_layers.targets[]")
-        for t in lora_conf["targets"]:
-            blocks = None
-            if t.get("blocks") is not None:
-                blocks = BlockRange(**t["blocks"])
-            targets.append(
-                LoraTargetSpec(
-                    module_path=t["module_path"],
-                    rank=t["rank"],
-                    blocks=blocks,
-                )
-            )
-
-        lora_layers = LoraLayersSpec(targets=targets)
-
         if is_edit and any(item.input_image is None for item in data):
             raise ValueError("Edit training requires input_image for every data item.")
         if is_edit and monitoring is not None:
@@ -405,6 +397,9 @@ class TrainingSpec:
         if not is_edit and monitoring is not None and preview_image_paths:
             raise ValueError("data/preview.* is only supported for edit training.")
 
+        if create_output_dir:
+            os.makedirs(checkpoint.output_path, exist_ok=True)
+
         return TrainingSpec(
             model=config["model"],
             model_path=config.get("model_path"),
@@ -449,13 +444,8 @@ class TrainingSpec:
 
     @staticmethod
     def _find_preview_images_in_data(root_dir: Path) -> dict[str, Path]:
-        image_exts = {".jpg", ".jpeg", ".png", ".webp"}
         previews: dict[str, Path] = {}
-        for path in root_dir.iterdir():
-            if not path.is_file():
-                continue
-            if path.suffix.lower() not in image_exts:
-                continue
+        for path in TrainingSpec._list_image_files(root_dir):
             if not path.stem.startswith("preview"):
                 continue
             if path.stem in previews:
@@ -463,6 +453,29 @@ class TrainingSpec:
             previews[path.stem] = path.resolve()
         return previews
 
+    @staticmethod
+    def _list_image_files(root_dir: Path) -> list[Path]:
+        return TrainingSpec._scan_data_dir(root_dir)[0]
+
+    @staticmethod
+    def _scan_data_dir(root_dir: Path) -> tuple[list[Path], set[str]]:
+        # One scandir pass yields both the image files and every entry name for the prompt file checks;
+        # it reuses the file type from the directory listing instead of a stat() per entry
+        image_files: list[Path] = []
+        file_names: set[str] = set()
+        with os.scandir(root_dir) as entries:
+            for entry in entries:
+                file_names.add(entry.name)
+                if os.path.splitext(entry.name)[1].lower() in TRAINING_DATA_IMAGE_EXTENSIONS and entry.is_file():
+                    image_files.append(Path(entry.path))
+        return sorted(image_files), file_names
+
+    @staticmethod
+    def _find_missing_files(root_dir: Path, required_names: Iterable[str], file_names: set[str]) -> set[str]:
+        # Set difference against the directory listing; only the leftovers hit the filesystem,
+        # which catches names that differ only in case (case-insensitive volumes)
+        return {name for name in set(required_names) - file_names if not (root_dir / name).exists()}
+
     @staticmethod
     def _discover_data(
         *, data_path: str, base_path: Path | None, exclude_paths: set[Path] | None = None
@@ -471,29 +484,22 @@ class TrainingSpec:
         if not root_dir.exists() or not root_dir.is_dir():
             raise ValueError(f"data path must be an existing directory when using auto-discovery: {root_dir}")
 
-        image_exts = {".jpg", ".jpeg", ".png", ".webp"}
-        excluded = set()
+        image_files, file_names = TrainingSpec._scan_data_dir(root_dir)
         if exclude_paths:
             excluded = {p.resolve() for p in exclude_paths}
-        image_files = sorted(
-            [
-                p
-                for p in root_dir.iterdir()
-                if p.is_file() and p.suffix.lower() in image_exts and p.resolve() not in excluded
-            ]
-        )
+            image_files = [p for p in image_files if p.resolve() not in excluded]
         if not image_files:
             raise ValueError(f"No image files found in data directory: {root_dir}")
 
         data_items: list[DataSpec] = []
-        out_files = [p for p in image_files if p.stem.endswith("_out")]
+        out_files = [p for p in image_files if p.stem.endswith(TRAINING_DATA_EDIT_OUTPUT_SUFFIX)]
         if out_files:
-            out_bases = {p.stem[: -len("_out")] for p in out_files}
+            out_bases = {p.stem[: -len(TRAINING_DATA_EDIT_OUTPUT_SUFFIX)] for p in out_files}
             for image_path in image_files:
-                if image_path.stem.endswith("_out"):
+                if image_path.stem.endswith(TRAINING_DATA_EDIT_OUTPUT_SUFFIX):
                     continue
-                if image_path.stem.endswith("_in"):
-                    base = image_path.stem[: -len("_in")]
+                if image_path.stem.endswith(TRAINING_DATA_EDIT_INPUT_SUFFIX):
+                    base = image_path.stem[: -len(TRAINING_DATA_EDIT_INPUT_SUFFIX)]
                     if base not in out_bases:
                         raise ValueError(
                             f"Found input image without matching output: {image_path.name}. "
@@ -505,22 +511,29 @@ class TrainingSpec:
                 )
             # Edit-style auto-discovery: match *_out.* to *_in.* and use *_in.txt for prompt.
             images_by_stem = {p.stem: p for p in image_files}
+            missing_prompt_files = TrainingSpec._find_missing_files(
+                root_dir,
+                (base + TRAINING_DATA_EDIT_INPUT_SUFFIX + TRAINING_DATA_PROMPT_SUFFIX for base in out_bases),
+                file_names,
+            )
             for out_path in sorted(out_files):
-                base = out_path.stem[: -len("_out")]
-                input_path = images_by_stem.get(f"{base}_in")
+                input_stem = out_path.stem[: -len(TRAINING_DATA_EDIT_OUTPUT_SUFFIX)] + TRAINING_DATA_EDIT_INPUT_SUFFIX
+                input_path = images_by_stem.get(input_stem)
                 if input_path is None:
-                    raise ValueError(f"Missing input image for '{out_path.name}'. Expected '{base}_in.*' in {root_dir}")
-                prompt_file = root_dir / f"{base}_in.txt"
-                if not prompt_file.exists():
                     raise ValueError(
-                        f"Missing prompt file for image '{input_path.name}'. Expected '{prompt_file.name}' in {root_dir}"
+                        f"Missing input image for '{out_path.name}'. Expected '{input_stem}.*' in {root_dir}"
+                    )
+                prompt_file_name = input_stem + TRAINING_DATA_PROMPT_SUFFIX
+                if prompt_file_name in missing_prompt_files:
+                    raise ValueError(
+                        f"Missing prompt file for image '{input_path.name}'. Expected '{prompt_file_name}' in {root_dir}"
                     )
                 data_items.append(
                     DataSpec.create(
                         {
                             "image": out_path.name,
                             "input_image": input_path.name,
-                            "prompt_file": prompt_file.name,
+                            "prompt_file": prompt_file_name,
                         },
                         data_path,
                         base_path,
@@ -528,17 +541,19 @@ class TrainingSpec:
                 )
             return data_items
 
-        for image_path in image_files:
-            prompt_file = image_path.with_suffix(".txt")
-            if not prompt_file.exists():
+        # Compose the prompt names as strings rather than deriving a new Path per image
+        prompt_file_names = [image_path.stem + TRAINING_DATA_PROMPT_SUFFIX for image_path in image_files]
+        missing_prompt_files = TrainingSpec._find_missing_files(root_dir, prompt_file_names, file_names)
+        for image_path, prompt_file_name in zip(image_files, prompt_file_names):
+            if prompt_file_name in missing_prompt_files:
                 raise ValueError(
-                    f"Missing prompt file for image '{image_path.name}'. Expected '{prompt_file.name}' in {root_dir}"
+                    f"Missing prompt file for image '{image_path.name}'. Expected '{prompt_file_name}' in {root_dir}"
                 )
             data_items.append(
                 DataSpec.create(
                     {
                         "image": image_path.name,
-                        "prompt_file": prompt_file.name,
+                        "prompt_file": prompt_file_name,
                     },
                     data_path,
                     base_path,
@@ -575,8 +590,8 @@ class TrainingSpec:
 
     @staticmethod
     def _from_checkpoint(path: str, new_folder: bool, *, create_output_dir: bool = True) -> "TrainingSpec":
-        checkpoint = ZipUtil.unzip(path, "checkpoint.json", lambda x: json.load(open(x, "r")))
-        config = ZipUtil.unzip(path, checkpoint["files"]["config"], lambda x: json.load(open(x, "r")))
+        checkpoint = ZipUtil.read_json(path, "checkpoint.json")
+        config = ZipUtil.read_json(path, checkpoint["files"]["config"])
         run_manifest = TrainingSpec._load_run_manifest(path)
         resolved_data_root = TrainingSpec._resolve_data_root_from_manifest(
             run_manifest=run_manifest,
@@ -598,7 +613,7 @@ class TrainingSpec:
     @staticmethod
     def _load_run_manifest(path: str) -> dict:
         try:
-            return ZipUtil.unzip(path, TRAINING_FILE_NAME_RUN_MANIFEST, lambda x: json.load(open(x, "r")))
+            return ZipUtil.read_json(path, TRAINING_FILE_NAME_RUN_MANIFEST)
         except FileNotFoundError as exc:
             raise ValueError(
                 "Resume requires a checkpoint zip containing run.json. "
@@ -51,9 +51,7 @@ class TrainingState:
             iterator_path = Path(temp_dir) / f"{self.iterator.num_iterations:07d}_{TRAINING_FILE_NAME_ITERATOR}.json"
             loss_path = Path(temp_dir) / f"{self.iterator.num_iterations:07d}_{TRAINING_FILE_NAME_LOSS_FILE}.json"
             config_path = Path(temp_dir) / f"{self.iterator.num_iterations:07d}_{TRAINING_FILE_NAME_CONFIG_FILE}.json"
-            checkpoint_path = Path(temp_dir) / f"{TRAINING_FILE_NAME_CHECKPOINT}.json"
-            manifest_path = Path(temp_dir) / TRAINING_FILE_NAME_RUN_MANIFEST
-            paths = [optimizer_path, lora_path, iterator_path, loss_path, config_path, checkpoint_path, manifest_path]
+            paths = [optimizer_path, lora_path, iterator_path, loss_path, config_path]
 
             self.optimizer.save(optimizer_path)
             adapter.save_lora_adapter(path=lora_path, training_spec=training_spec)
@@ -62,8 +60,6 @@ class TrainingState:
             self._save_train_config(config_path, training_spec)
 
             checkpoint_data = self._create_checkpoint_data(training_spec, self.iterator.start_date_time)
-            with open(checkpoint_path, "w") as json_file:
-                json.dump(checkpoint_data, json_file, indent=4)
 
             output_path = Path(training_spec.checkpoint.output_path) / TRAINING_PATH_CHECKPOINTS
             output_path.mkdir(parents=True, exist_ok=True)
@@ -74,13 +70,22 @@ class TrainingState:
                 checkpoint_data=checkpoint_data,
                 checkpoint_dir=output_path,
             )
-            with open(manifest_path, "w", encoding="utf-8") as json_file:
-                json.dump(run_manifest, json_file, indent=4)
 
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                for file_path in paths:
-                    if file_path.exists():
-                        zipf.write(file_path, file_path.name)
+            # Build the archive next to its final location and swap it in atomically, so a concurrent
+            # reader (or an interrupted save) never sees a partially written checkpoint.
+            partial_zip_path = zip_path.with_name(f"{zip_path.name}.partial")
+            try:
+                with zipfile.ZipFile(partial_zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+                    for file_path in paths:
+                        if file_path.exists():
+                            zipf.write(file_path, file_path.name)
+                    # Small JSON members go straight into the archive instead of round-tripping through temp files
+                    zipf.writestr(f"{TRAINING_FILE_NAME_CHECKPOINT}.json", json.dumps(checkpoint_data, indent=4))
+                    zipf.writestr(TRAINING_FILE_NAME_RUN_MANIFEST, json.dumps(run_manifest, indent=4))
+            except BaseException:
+                partial_zip_path.unlink(missing_ok=True)
+                raise
+            os.replace(partial_zip_path, zip_path)
 
     def _create_run_manifest(
         self,
@@ -213,12 +218,8 @@ class TrainingState:
                     raise ValueError("Config 'data' must be a string or {'path': ...}.")
                 data["data"] = str(resolved_path)
         else:
-            checkpoint = ZipUtil.unzip(
-                training_spec.checkpoint_path, "checkpoint.json", lambda x: json.load(open(x, "r"))
-            )
-            data = ZipUtil.unzip(
-                training_spec.checkpoint_path, checkpoint["files"]["config"], lambda x: json.load(open(x, "r"))
-            )
+            checkpoint = ZipUtil.read_json(training_spec.checkpoint_path, "checkpoint.json")
+            data = ZipUtil.read_json(training_spec.checkpoint_path, checkpoint["files"]["config"])
             if training_spec.data_root is not None:
                 data["data"] = training_spec.data_root
         with open(path, "w", encoding="utf-8") as file:
@@ -1,4 +1,5 @@
 import json
+import os
 from pathlib import Path
 
 from mflux.models.common.training.state.training_spec import TrainingSpec
@@ -34,23 +35,25 @@ class Plotter:
         padding_limit = initial_padding - (initial_padding - final_padding) * (max_x / total_step)
         padding = max_x * padding_limit
 
-        preview_rel_root = Path("..") / TRAINING_PATH_PREVIEW_IMAGES
+        # The name template and relative prefix are fixed per plot; only the step number varies per entry
+        preview_rel_prefix = (Path("..") / TRAINING_PATH_PREVIEW_IMAGES).as_posix() + "/"
         preview_abs_root = Path(training_spec.checkpoint.output_path) / TRAINING_PATH_PREVIEW_IMAGES
+        preview_name_suffix = f"_{TRAINING_FILE_NAME_PREVIEW_IMAGE}_{preview_suffix}.png"
+        # One directory listing instead of an exists() stat per logged step
+        preview_file_names = Plotter._list_file_names(preview_abs_root)
         preview_step_to_src: dict[int, str] = {}
         for step in steps:
-            preview_name = f"{int(step):07d}_{TRAINING_FILE_NAME_PREVIEW_IMAGE}_{preview_suffix}.png"
-            preview_src = (preview_rel_root / preview_name).as_posix()
-            preview_abs = preview_abs_root / preview_name
-            if preview_abs.exists():
-                preview_step_to_src[int(step)] = preview_src
+            preview_name = f"{step:07d}{preview_name_suffix}"
+            if preview_name in preview_file_names:
+                preview_step_to_src[step] = preview_rel_prefix + preview_name
 
         if 0 not in preview_step_to_src:
-            preview_zero = preview_abs_root / f"{0:07d}_{TRAINING_FILE_NAME_PREVIEW_IMAGE}_{preview_suffix}.png"
-            if preview_zero.exists():
-                preview_step_to_src[0] = (preview_rel_root / preview_zero.name).as_posix()
+            preview_zero_name = f"{0:07d}{preview_name_suffix}"
+            if preview_zero_name in preview_file_names:
+                preview_step_to_src[0] = preview_rel_prefix + preview_zero_name
 
         preview_steps = sorted(preview_step_to_src.keys())
-        loss_by_step = {int(step): float(loss) for step, loss in zip(steps, losses)}
+        loss_by_step = dict(zip(steps, losses))
         smoothed = Plotter._smooth_losses(losses, smooth_window)
 
         data = {
@@ -69,15 +72,26 @@ class Plotter:
         with open(path, "w", encoding="utf-8") as f:
             f.write(html)
 
+    @staticmethod
+    def _list_file_names(directory: Path) -> set[str]:
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return set()
+
     @staticmethod
     def _smooth_losses(values: list[float], window: int) -> list[float]:
         if window <= 1:
             return list(values)
+        # Running window sum: O(n) per plot instead of re-summing each window slice
         smoothed: list[float] = []
+        window_sum = 0.0
         for i, val in enumerate(values):
-            start = max(0, i - window + 1)
-            window_values = values[start : i + 1]
-            smoothed.append(float(sum(window_values)) / float(len(window_values)))
+            window_sum += val
+            if i >= window:
+                window_sum -= values[i - window]
+            smoothed.append(window_sum / min(i + 1, window))
         return smoothed
 
     @staticmethod
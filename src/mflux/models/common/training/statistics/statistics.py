@@ -20,10 +20,9 @@ class Statistics:
             return Statistics()
 
         stats = Statistics()
-        data = ZipUtil.unzip(
+        data = ZipUtil.read_json(
             zip_path=training_spec.checkpoint_path,
             filename=training_spec.statistics.state_path,
-            loader=lambda x: json.load(open(x, "r")),
         )
         for entry in data:
             stats.steps.append(entry["step"])
@@ -43,4 +42,5 @@ class Statistics:
             for step, loss, time in zip(self.steps, self.losses, self.times)
         ]
         with open(path, "w", encoding="utf-8") as file:
-            json.dump(loss_entries, file, indent=4)
+            # Machine-read history that grows every step; skip the pretty-printer whitespace
+            json.dump(loss_entries, file, separators=(",", ":"))
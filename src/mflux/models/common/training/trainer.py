@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import gc
 import random
+import sys
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import mlx.core as mx
@@ -11,6 +14,7 @@ from mlx.utils import tree_unflatten
 from PIL import Image as PILImage
 from tqdm import tqdm
 
+from mflux.models.common.config.config import Config
 from mflux.models.common.latent_creator.latent_creator import LatentCreator
 from mflux.models.common.lora.layer.fused_linear_lora_layer import FusedLoRALinear
 from mflux.models.common.lora.layer.linear_lora_layer import LoRALinear
@@ -22,19 +26,36 @@ from mflux.models.common.training.statistics.plotter import Plotter
 from mflux.models.common.training.utils import TrainingUtil
 
 
+@partial(mx.compile, shapeless=True)
+def _squared_residual(clean_image, predicted_noise, pure_noise):
+    # Fused into one elementwise kernel; model math stays in the training precision, the error is float32
+    return (clean_image + predicted_noise - pure_noise).astype(mx.float32).square()
+
+
 class TrainingTrainer:
+    # Preview images are re-used at every preview step; read each header once per training run
+    _preview_image_sizes: dict[Path, tuple[int, int]] = {}
+    # When stderr is redirected (nohup, CI, docker logs) a redraw per step only bloats the log
+    NON_TTY_PROGRESS_INTERVAL_SECONDS = 60.0
+
     @staticmethod
     def compute_loss(
         adapter: TrainingAdapter,
         training_spec: TrainingSpec,
         base_config,
         batch: Batch,
-    ) -> mx.float16:
+        config_cache: dict[tuple[int, int], Config] | None = None,
+    ) -> mx.array:
+        # One key per batch, split per example, instead of seeding a fresh key for every example.
+        # getrandbits(32) reads one Mersenne Twister word; randint(0, 2**32 - 1) draws 33 bits and rejects half.
+        noise_keys = mx.random.split(mx.random.key(batch.rng.getrandbits(32)), num=len(batch.data))
         losses = [
-            TrainingTrainer._single_example_loss(adapter, training_spec, base_config, item, batch.rng)
-            for item in batch.data
+            TrainingTrainer._single_example_loss(
+                adapter, training_spec, base_config, item, batch.rng, noise_key, config_cache
+            )
+            for item, noise_key in zip(batch.data, noise_keys)
         ]
-        return mx.mean(mx.array(losses))
+        return mx.stack(losses).mean()
 
     @staticmethod
     def _single_example_loss(
@@ -43,20 +64,10 @@ class TrainingTrainer:
         base_config,
         item: DataItem,
         rng: random.Random,
-    ) -> mx.float16:
-        # Create a config matching this item's spatial dimensions.
-        # Flux uses config.width/height for rotary embeddings, so this must match the latent layout.
-        config = adapter.create_config(training_spec, width=item.width, height=item.height)
-
-        # Reuse the base scheduler only when compatible with the item's dimensions.
-        # Some schedulers depend on image seq len when sigma shift is enabled.
-        if not config.model_config.requires_sigma_shift or config.image_seq_len == base_config.image_seq_len:
-            config._scheduler = base_config.scheduler  # type: ignore[attr-defined]
-        else:
-            _ = config.scheduler
-
-        time_seed = rng.randint(0, 2**32 - 1)
-        noise_seed = rng.randint(0, 2**32 - 1)
+        noise_key: mx.array,
+        config_cache: dict[tuple[int, int], Config] | None = None,
+    ) -> mx.array:
+        config = TrainingTrainer._item_config(adapter, training_spec, base_config, item, config_cache)
 
         low = int(training_spec.training_loop.timestep_low)
         high = int(
@@ -65,20 +76,14 @@ class TrainingTrainer:
             else training_spec.training_loop.timestep_high
         )
 
-        t = int(
-            mx.random.randint(
-                low=low,
-                high=high,
-                shape=[],
-                key=mx.random.key(time_seed),
-            )
-        )
+        # Sample the timestep on the host: reading back an MLX randint would force a device sync per example.
+        t = rng.randrange(low, high)
 
         clean_image = item.clean_latents
         pure_noise = mx.random.normal(
             shape=clean_image.shape,
             dtype=config.precision,
-            key=mx.random.key(noise_seed),
+            key=noise_key,
         )
 
         latents_t = LatentCreator.add_noise_by_interpolation(
@@ -95,8 +100,34 @@ class TrainingTrainer:
             config=config,
         )
 
-        error = (clean_image + predicted_noise - pure_noise).square()
-        return error.mean()
+        return _squared_residual(clean_image, predicted_noise, pure_noise).mean()
+
+    @staticmethod
+    def _item_config(
+        adapter: TrainingAdapter,
+        training_spec: TrainingSpec,
+        base_config,
+        item: DataItem,
+        config_cache: dict[tuple[int, int], Config] | None,
+    ) -> Config:
+        key = (item.width, item.height)
+        if config_cache is not None and key in config_cache:
+            return config_cache[key]
+
+        # Create a config matching this item's spatial dimensions.
+        # Flux uses config.width/height for rotary embeddings, so this must match the latent layout.
+        config = adapter.create_config(training_spec, width=item.width, height=item.height)
+
+        # Reuse the base scheduler only when compatible with the item's dimensions.
+        # Some schedulers depend on image seq len when sigma shift is enabled.
+        if not config.model_config.requires_sigma_shift or config.image_seq_len == base_config.image_seq_len:
+            config._scheduler = base_config.scheduler  # type: ignore[attr-defined]
+        else:
+            _ = config.scheduler
+
+        if config_cache is not None:
+            config_cache[key] = config
+        return config
 
     @staticmethod
     def train(
@@ -105,6 +136,8 @@ class TrainingTrainer:
         training_spec: TrainingSpec,
         training_state: TrainingState,
     ) -> None:
+        # A new run may point at replaced preview files; never carry sizes over from a previous run
+        TrainingTrainer._preview_image_sizes.clear()
         first_preview = None
         if training_spec.monitoring is not None and training_spec.monitoring.preview_images:
             first_preview = training_spec.monitoring.preview_images[0]
@@ -112,6 +145,8 @@ class TrainingTrainer:
         base_config = adapter.create_config(training_spec, width=preview_width, height=preview_height)
         # Ensure scheduler is initialized once and can be reused in per-item configs.
         _ = base_config.scheduler
+        # Per-item configs depend only on the item's dimensions, so build each one once per run.
+        config_cache: dict[tuple[int, int], Config] = {}
 
         # Freeze base weights and unfreeze LoRA weights
         adapter.freeze_base()
@@ -119,13 +154,15 @@ class TrainingTrainer:
 
         train_step_function = nn.value_and_grad(
             model=adapter.model(),
-            fn=lambda b: TrainingTrainer.compute_loss(adapter, training_spec, base_config, b),
+            fn=lambda b: TrainingTrainer.compute_loss(adapter, training_spec, base_config, b, config_cache),
         )
 
         if training_spec.monitoring is not None and training_state.iterator.num_iterations == 0:
             TrainingTrainer._generate_previews_with_optimizer_offload(adapter, training_spec, training_state)
             validation_batch = training_state.iterator.get_validation_batch()
-            validation_loss = TrainingTrainer.compute_loss(adapter, training_spec, base_config, validation_batch)
+            validation_loss = TrainingTrainer.compute_loss(
+                adapter, training_spec, base_config, validation_batch, config_cache
+            )
             training_state.statistics.append_values(step=training_state.iterator.num_iterations, loss=float(validation_loss))  # fmt: off
             Plotter.update_loss_plot(training_spec=training_spec, training_state=training_state)
             del validation_loss
@@ -135,6 +172,7 @@ class TrainingTrainer:
             training_state.iterator,
             total=training_state.iterator.total_number_of_steps(),
             initial=training_state.iterator.num_iterations,
+            mininterval=TrainingTrainer._progress_interval(),
         )
 
         for batch in batches:
@@ -145,7 +183,9 @@ class TrainingTrainer:
 
             if training_state.should_plot_loss(training_spec):
                 validation_batch = training_state.iterator.get_validation_batch()
-                validation_loss = TrainingTrainer.compute_loss(adapter, training_spec, base_config, validation_batch)
+                validation_loss = TrainingTrainer.compute_loss(
+                    adapter, training_spec, base_config, validation_batch, config_cache
+                )
                 training_state.statistics.append_values(step=training_state.iterator.num_iterations, loss=float(validation_loss))  # fmt: off
                 Plotter.update_loss_plot(training_spec=training_spec, training_state=training_state)
                 del validation_loss
@@ -161,6 +201,11 @@ class TrainingTrainer:
 
         training_state.save(adapter, training_spec)
 
+    @staticmethod
+    def _progress_interval() -> float:
+        # tqdm's own default; it writes to stderr
+        return 0.1 if sys.stderr.isatty() else TrainingTrainer.NON_TTY_PROGRESS_INTERVAL_SECONDS
+
     @staticmethod
     def _unfreeze_lora_layers(module: nn.Module) -> None:
         for _, child in module.named_modules():
@@ -177,8 +222,7 @@ class TrainingTrainer:
         if training_spec.monitoring is None:
             return 1024, 1024
         if preview_image is not None:
-            with PILImage.open(preview_image) as img:
-                width, height = img.size
+            width, height = TrainingTrainer._preview_image_size(preview_image)
         else:
             width = int(training_spec.monitoring.preview_width)
             height = int(training_spec.monitoring.preview_height)
@@ -203,34 +247,38 @@ class TrainingTrainer:
         preview_prompts = training_spec.monitoring.preview_prompts
         preview_names = training_spec.monitoring.preview_prompt_names
         preview_images = training_spec.monitoring.preview_images
-        for idx, prompt in enumerate(preview_prompts):
-            image_paths = None
-            if training_spec.is_edit:
-                if not preview_images or idx >= len(preview_images):
-                    raise ValueError("Edit training requires data/preview.* for each preview prompt.")
-                image_paths = [preview_images[idx]]
-                preview_width, preview_height = TrainingTrainer._preview_dimensions(
-                    training_spec, preview_image=preview_images[idx]
+        # PNG encoding runs on a writer thread so it overlaps with generating the next preview
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            pending_saves: list[Future] = []
+            for idx, prompt in enumerate(preview_prompts):
+                image_paths = None
+                if training_spec.is_edit:
+                    if not preview_images or idx >= len(preview_images):
+                        raise ValueError("Edit training requires data/preview.* for each preview prompt.")
+                    image_paths = [preview_images[idx]]
+                    preview_width, preview_height = TrainingTrainer._preview_dimensions(
+                        training_spec, preview_image=preview_images[idx]
+                    )
+                else:
+                    preview_width, preview_height = TrainingTrainer._preview_dimensions(training_spec)
+                image = adapter.generate_preview_image(
+                    seed=training_spec.seed,
+                    prompt=prompt,
+                    width=preview_width,
+                    height=preview_height,
+                    steps=training_spec.steps,
+                    image_paths=image_paths,
                 )
-            else:
-                preview_width, preview_height = TrainingTrainer._preview_dimensions(training_spec)
-            image = adapter.generate_preview_image(
-                seed=training_spec.seed,
-                prompt=prompt,
-                width=preview_width,
-                height=preview_height,
-                steps=training_spec.steps,
-                image_paths=image_paths,
-            )
-            preview_name = preview_names[idx] if idx < len(preview_names) else None
-            image.save(
-                training_state.get_current_preview_image_path(
+                preview_name = preview_names[idx] if idx < len(preview_names) else None
+                preview_path = training_state.get_current_preview_image_path(
                     training_spec,
                     preview_index=idx,
                     preview_name=preview_name,
                 )
-            )
-            del image
+                pending_saves.append(writer.submit(image.save, preview_path))
+                del image
+            for pending_save in pending_saves:
+                pending_save.result()
 
     @staticmethod
     def _generate_previews_with_optimizer_offload(
@@ -253,3 +301,12 @@ class TrainingTrainer:
                 optimizer.optimizer.state = restored_state
                 gc.collect()
                 mx.clear_cache()
+
+    @staticmethod
+    def _preview_image_size(preview_image: Path) -> tuple[int, int]:
+        size = TrainingTrainer._preview_image_sizes.get(preview_image)
+        if size is None:
+            with PILImage.open(preview_image) as img:
+                size = img.size
+            TrainingTrainer._preview_image_sizes[preview_image] = size
+        return size
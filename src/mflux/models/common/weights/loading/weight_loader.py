@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING
 
 import mlx.core as mx
 import torch
-from huggingface_hub import snapshot_download
 from mlx.utils import tree_unflatten
 from safetensors.torch import load_file as torch_load_file
 
@@ -31,7 +30,7 @@ class WeightLoader:
         repo_id: str,
         file_pattern: str = "*.safetensors",
     ) -> LoadedWeights:
-        root_path = Path(snapshot_download(repo_id=repo_id, allow_patterns=[file_pattern, "config.json"]))
+        root_path = PathResolution.resolve(path=repo_id, patterns=[file_pattern, "config.json"])
         weights, q_level, version = WeightLoader._load_component(root_path, component)
         return LoadedWeights(
             components={component.name: weights},
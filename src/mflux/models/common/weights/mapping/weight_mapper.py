@@ -5,6 +5,10 @@ import mlx.core as mx
 
 from mflux.models.common.weights.mapping.weight_mapping import WeightTarget
 
+# Also matches single_transformer_blocks.{number}. since the search is unanchored
+TRANSFORMER_BLOCK_PATTERN = re.compile(r"transformer_blocks\.(\d+)\.")
+TEXT_ENCODER_LAYER_PATTERN = re.compile(r"model\.layers\.(\d+)\.")
+
 
 class WeightMapper:
     @staticmethod
@@ -58,13 +62,8 @@ class WeightMapper:
     def _detect_num_blocks(hf_weights: Dict[str, mx.array]) -> int:
         block_numbers = set()
         for key in hf_weights.keys():
-            # Match pattern: transformer_blocks.{number}.something
-            match = re.search(r"transformer_blocks\.(\d+)\.", key)
-            if match:
-                block_numbers.add(int(match.group(1)))
-                continue
-            # Match pattern: single_transformer_blocks.{number}.something
-            match = re.search(r"single_transformer_blocks\.(\d+)\.", key)
+            # Match pattern: (single_)transformer_blocks.{number}.something
+            match = TRANSFORMER_BLOCK_PATTERN.search(key)
             if match:
                 block_numbers.add(int(match.group(1)))
 
@@ -77,7 +76,7 @@ class WeightMapper:
         layer_numbers = set()
         for key in hf_weights.keys():
             # Match pattern: model.layers.{number}.something
-            match = re.search(r"model\.layers\.(\d+)\.", key)
+            match = TEXT_ENCODER_LAYER_PATTERN.search(key)
             if match:
                 layer_numbers.add(int(match.group(1)))
 
@@ -97,14 +96,18 @@ class WeightMapper:
             flat[hf_key].append((mlx_path, transform))
 
         for target in mapping:
+            # The target pattern is shared by every source pattern, so scan it once
+            to_has_block = "{block}" in target.to_pattern
+            to_has_i = "{i}" in target.to_pattern
+            to_has_res = "{res}" in target.to_pattern
+            to_has_layer = "{layer}" in target.to_pattern
             # Expand placeholders for each pattern
             for hf_pattern in target.from_pattern:
                 # Check which placeholders are present in BOTH patterns
                 hf_has_block = "{block}" in hf_pattern
-                to_has_block = "{block}" in target.to_pattern
-                has_i = "{i}" in hf_pattern or "{i}" in target.to_pattern
-                has_res = "{res}" in hf_pattern or "{res}" in target.to_pattern
-                has_layer = "{layer}" in hf_pattern or "{layer}" in target.to_pattern
+                has_i = to_has_i or "{i}" in hf_pattern
+                has_res = to_has_res or "{res}" in hf_pattern
+                has_layer = to_has_layer or "{layer}" in hf_pattern
 
                 # Handle multiple placeholders together
                 if (hf_has_block or to_has_block) and has_res:
@@ -46,7 +46,7 @@ class FiboEditUtil:
 
         image = ImageUtil.load_image(args.image_path)
         if getattr(args, "mask_path", None) is not None:
-            mask_image = Image.open(args.mask_path).convert("L")
+            mask_image = FiboEditUtil._load_mask(args.mask_path)
             if mask_image.size != image.size:
                 raise ValueError("Mask and image must have the same size.")
             image = FiboEditUtil._composite_mask_on_image(mask=mask_image, image=image)
@@ -98,7 +98,7 @@ class FiboEditUtil:
         if mask_path is None:
             return ImageUtil.scale_to_dimensions(image, width, height)
 
-        mask_image = Image.open(mask_path).convert("L")
+        mask_image = FiboEditUtil._load_mask(mask_path)
         if mask_image.size != image.size:
             raise ValueError("Mask and image must have the same size.")
 
@@ -130,14 +130,25 @@ class FiboEditUtil:
         latent_image_ids = mx.reshape(latent_image_ids, (1, latent_height * latent_width, 3))
         return latent_image_ids
 
+    @staticmethod
+    def _load_mask(mask_path: Path | str) -> Image.Image:
+        # Close the source file as soon as the grayscale copy is decoded
+        with Image.open(mask_path) as mask:
+            return mask.convert("L")
+
     @staticmethod
     def _composite_mask_on_image(mask: Image.Image, image: Image.Image) -> Image.Image:
+        # convert() always allocates a new image, so only call it when the mode actually differs
         gray_img = Image.new("RGB", image.size, (128, 128, 128))
-        return Image.composite(gray_img, image.convert("RGB"), mask.convert("L"))
+        rgb_image = image if image.mode == "RGB" else image.convert("RGB")
+        gray_mask = mask if mask.mode == "L" else mask.convert("L")
+        return Image.composite(gray_img, rgb_image, gray_mask)
 
     @staticmethod
     def build_rgba_composite_image(source_image_path: Path | str, matte_image: Image.Image) -> Image.Image:
-        base = Image.open(source_image_path).convert("RGB").copy()
-        alpha = matte_image.convert("L").resize(base.size, Image.LANCZOS)
+        with Image.open(source_image_path) as source:
+            base = source.convert("RGB")
+        matte = matte_image if matte_image.mode == "L" else matte_image.convert("L")
+        alpha = matte.resize(base.size, Image.LANCZOS)
         base.putalpha(alpha)
         return base
@@ -32,7 +32,7 @@ class DepthUtil:
 
         # 2. Encode the depth map
         scaled_depth_map = ImageUtil.scale_to_dimensions(
-            image=ImageUtil.load_image(depth_image_path).convert("RGB"),
+            image=ImageUtil.load_image(depth_image_path, draft_size=(config.width, config.height)),
             target_width=config.width,
             target_height=config.height,
         )
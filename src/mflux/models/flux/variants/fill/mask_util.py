@@ -22,7 +22,7 @@ class MaskUtil:
 
         # 1. Get the reference image
         scaled_image = ImageUtil.scale_to_dimensions(
-            image=ImageUtil.load_image(img_path).convert("RGB"),
+            image=ImageUtil.load_image(img_path, draft_size=(width, height)),
             target_width=width,
             target_height=height,
         )
@@ -30,7 +30,7 @@ class MaskUtil:
 
         # 2. Get the mask
         scaled = ImageUtil.scale_to_dimensions(
-            image=ImageUtil.load_image(mask_path).convert("RGB"),
+            image=ImageUtil.load_image(mask_path, draft_size=(width, height)),
             target_width=width,
             target_height=height,
         )
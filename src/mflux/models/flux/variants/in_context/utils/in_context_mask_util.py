@@ -22,7 +22,7 @@ class InContextMaskUtil:
 
         # Step 1: Load left image (reference) - always required
         left_image = ImageUtil.scale_to_dimensions(
-            image=ImageUtil.load_image(left_image_path).convert("RGB"),
+            image=ImageUtil.load_image(left_image_path, draft_size=(original_width, height)),
             target_width=original_width,
             target_height=height,
         )
@@ -35,7 +35,7 @@ class InContextMaskUtil:
         else:
             # Selective mode: load target image for right side
             right_image = ImageUtil.scale_to_dimensions(
-                image=ImageUtil.load_image(right_image_path).convert("RGB"),
+                image=ImageUtil.load_image(right_image_path, draft_size=(original_width, height)),
                 target_width=original_width,
                 target_height=height,
             )
@@ -48,7 +48,7 @@ class InContextMaskUtil:
         else:
             # Selective: use provided mask exactly
             mask_image = ImageUtil.scale_to_dimensions(
-                image=ImageUtil.load_image(mask_path).convert("RGB"),
+                image=ImageUtil.load_image(mask_path, draft_size=(original_width, height)),
                 target_width=original_width,
                 target_height=height,
             )
@@ -102,11 +102,14 @@ class Ideogram4Initializer:
     @staticmethod
     def _apply_lora(model, lora_paths: list[str] | None, lora_scales: list[float] | None) -> None:
         lora_mapping = Ideogram4LoRAMapping.get_mapping()
+        # PatternMatch entries are frozen, so one table can be shared by both transformers
+        pattern_mappings = LoRALoader._build_pattern_mappings(lora_mapping)
         model.lora_paths, model.lora_scales = LoRALoader.load_and_apply_lora(
             lora_mapping=lora_mapping,
             transformer=model.conditional_transformer,
             lora_paths=lora_paths,
             lora_scales=lora_scales,
+            pattern_mappings=pattern_mappings,
         )
         if not model.lora_paths:
             return
@@ -115,7 +118,7 @@ class Ideogram4Initializer:
                 model.unconditional_transformer,
                 lora_file,
                 scale,
-                lora_mapping,
+                pattern_mappings,
                 role=None,
             )
 
@@ -1,16 +1,25 @@
+import re
 from typing import Optional
 
 
 class QwenPromptRewriter:
+    # Each term list is one compiled alternation, so a prompt is scanned once per check rather than once per term
+    CHINESE_CHARACTER_PATTERN = re.compile("[\u4e00-\u9fff]")
+    EN_QUALITY_PATTERN = re.compile("ultra hd|4k|cinematic|high quality|detailed", re.IGNORECASE)
+    EN_EDIT_PATTERN = re.compile("change|replace|modify|edit", re.IGNORECASE)
+    EN_PRESERVE_PATTERN = re.compile("maintain|keep", re.IGNORECASE)
+    EN_ART_STYLE_PATTERN = re.compile("watercolor|oil painting|sketch|digital art|anime|cartoon", re.IGNORECASE)
+    ZH_QUALITY_PATTERN = re.compile("超清|4k|高质量|精细|电影级")
+    ZH_EDIT_PATTERN = re.compile("改变|替换|修改|编辑|变成")
+    ZH_PRESERVE_PATTERN = re.compile("保持|维持")
+    EDIT_INSTRUCTION_PATTERNS = {
+        "en": re.compile("transform|change|modify|edit|replace|add|remove", re.IGNORECASE),
+        "zh": re.compile("转换|改变|修改|编辑|替换|添加|移除|变成"),
+    }
+
     @staticmethod
     def detect_language(prompt: str) -> str:
-        chinese_ranges = [
-            ("\u4e00", "\u9fff"),
-        ]
-        for char in prompt:
-            if any(start <= char <= end for start, end in chinese_ranges):
-                return "zh"
-        return "en"
+        return "zh" if QwenPromptRewriter.CHINESE_CHARACTER_PATTERN.search(prompt) else "en"
 
     @staticmethod
     def enhance_prompt_en(original_prompt: str) -> str:
@@ -18,20 +27,16 @@ class QwenPromptRewriter:
         prompt = original_prompt.strip()
 
         # Add style and quality enhancers if not present
-        quality_terms = ["ultra hd", "4k", "cinematic", "high quality", "detailed"]
-        has_quality = any(term in prompt.lower() for term in quality_terms)
-
-        if not has_quality:
+        if not QwenPromptRewriter.EN_QUALITY_PATTERN.search(prompt):
             prompt += ", ultra HD, 4K, cinematic composition, high quality, detailed"
 
         # Enhance editing-specific instructions
-        if any(word in prompt.lower() for word in ["change", "replace", "modify", "edit"]):
-            if "maintain" not in prompt.lower() and "keep" not in prompt.lower():
+        if QwenPromptRewriter.EN_EDIT_PATTERN.search(prompt):
+            if not QwenPromptRewriter.EN_PRESERVE_PATTERN.search(prompt):
                 prompt += ", maintain original composition and lighting"
 
         # Add style consistency for artistic transformations
-        art_styles = ["watercolor", "oil painting", "sketch", "digital art", "anime", "cartoon"]
-        if any(style in prompt.lower() for style in art_styles):
+        if QwenPromptRewriter.EN_ART_STYLE_PATTERN.search(prompt):
             prompt += ", consistent artistic style throughout"
 
         return prompt
@@ -42,16 +47,12 @@ class QwenPromptRewriter:
         prompt = original_prompt.strip()
 
         # Add quality enhancers for Chinese prompts
-        quality_terms = ["超清", "4k", "高质量", "精细", "电影级"]
-        has_quality = any(term in prompt for term in quality_terms)
-
-        if not has_quality:
+        if not QwenPromptRewriter.ZH_QUALITY_PATTERN.search(prompt):
             prompt += "，超清，4K，电影级构图，高质量，精细"
 
         # Enhance editing-specific instructions
-        edit_terms = ["改变", "替换", "修改", "编辑", "变成"]
-        if any(term in prompt for term in edit_terms):
-            if "保持" not in prompt and "维持" not in prompt:
+        if QwenPromptRewriter.ZH_EDIT_PATTERN.search(prompt):
+            if not QwenPromptRewriter.ZH_PRESERVE_PATTERN.search(prompt):
                 prompt += "，保持原有构图和光线"
 
         return prompt
@@ -66,13 +67,7 @@ class QwenPromptRewriter:
             enhanced = QwenPromptRewriter.enhance_prompt_en(prompt)
 
         # Add edit-specific stability improvements
-        edit_keywords = {
-            "en": ["transform", "change", "modify", "edit", "replace", "add", "remove"],
-            "zh": ["转换", "改变", "修改", "编辑", "替换", "添加", "移除", "变成"],
-        }
-
-        current_keywords = edit_keywords[language]
-        has_edit_instruction = any(keyword in enhanced.lower() for keyword in current_keywords)
+        has_edit_instruction = QwenPromptRewriter.EDIT_INSTRUCTION_PATTERNS[language].search(enhanced) is not None
 
         if has_edit_instruction:
             if language == "zh":
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from mflux.callbacks.callback_manager import CallbackManager
@@ -19,8 +20,16 @@ SUPPORTED_IMAGE_SUFFIXES = {
 }
 
 
-def _is_image_file(path: Path) -> bool:
-    return path.is_file() and path.suffix.lower() in SUPPORTED_IMAGE_SUFFIXES
+def _list_image_files(directory: Path) -> list[Path]:
+    # Filter on DirEntry names and cached types; only the selected files become Path objects
+    with os.scandir(directory) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in SUPPORTED_IMAGE_SUFFIXES and entry.is_file()
+        ]
+    names.sort(key=str.lower)
+    return [directory / name for name in names]
 
 
 def _resolve_seedvr2_model(model_arg: str | None, model_path: str | None) -> tuple[ModelConfig, str | None]:
@@ -53,10 +62,7 @@ def _expand_image_paths(image_paths: list[Path]) -> list[Path]:
     expanded: list[Path] = []
     for image_path in image_paths:
         if image_path.is_dir():
-            dir_images = sorted(
-                [path for path in image_path.iterdir() if _is_image_file(path)],
-                key=lambda path: path.name.lower(),
-            )
+            dir_images = _list_image_files(image_path)
             if not dir_images:
                 print(f"No images found in directory: {image_path}")
             expanded.extend(dir_images)
@@ -1,8 +1,12 @@
+import ctypes
+import ctypes.util
 import platform
 import subprocess
 
 
 class AppleSiliconUtil:
+    CHIP_NAME_SYSCTL = "machdep.cpu.brand_string"
+
     _chip_name: str | None = None
 
     @classmethod
@@ -16,18 +20,52 @@ class AppleSiliconUtil:
             return False
         return "apple m1" in chip_name or "apple m2" in chip_name
 
+    @staticmethod
+    def read_sysctl_string(name: str) -> str | None:
+        # sysctlbyname answers in-process, without forking the sysctl binary
+        library_path = ctypes.util.find_library("c")
+        if library_path is None:
+            return None
+        try:
+            sysctlbyname = ctypes.CDLL(library_path).sysctlbyname
+        except (OSError, AttributeError):
+            return None
+        sysctlbyname.argtypes = [
+            ctypes.c_char_p,
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_size_t),
+            ctypes.c_void_p,
+            ctypes.c_size_t,
+        ]
+        sysctlbyname.restype = ctypes.c_int
+        encoded_name = name.encode()
+        size = ctypes.c_size_t(0)
+        if sysctlbyname(encoded_name, None, ctypes.byref(size), None, 0) != 0 or size.value == 0:
+            return None
+        buffer = ctypes.create_string_buffer(size.value)
+        if sysctlbyname(encoded_name, buffer, ctypes.byref(size), None, 0) != 0:
+            return None
+        return buffer.value.decode(errors="replace").strip()
+
     @classmethod
     def _get_chip_name(cls) -> str:
         if cls._chip_name is not None:
             return cls._chip_name
+        chip_name = AppleSiliconUtil.read_sysctl_string(AppleSiliconUtil.CHIP_NAME_SYSCTL)
+        if chip_name is None:
+            chip_name = AppleSiliconUtil._read_sysctl_string_via_subprocess(AppleSiliconUtil.CHIP_NAME_SYSCTL)
+        cls._chip_name = chip_name
+        return cls._chip_name
+
+    @staticmethod
+    def _read_sysctl_string_via_subprocess(name: str) -> str:
         try:
             result = subprocess.run(
-                ["sysctl", "-n", "machdep.cpu.brand_string"],
+                ["sysctl", "-n", name],
                 capture_output=True,
                 text=True,
                 check=True,
             )
-            cls._chip_name = result.stdout.strip()
+            return result.stdout.strip()
         except (subprocess.CalledProcessError, OSError):
-            cls._chip_name = ""
-        return cls._chip_name
+            return ""
@@ -35,15 +35,12 @@ class BoxValues:
     def parse(value, delimiter=",") -> "BoxValues":
         parts = []
         for part_value in value.strip().split(delimiter):
-            try:
-                part = int(part_value.strip())
-                parts.append(part)
-            except ValueError:  # noqa: PERF203
-                # not an int - is it a %?
-                if (part_value := part_value.strip()).endswith("%"):
-                    parts.append(part_value)
-                else:
-                    raise BoxValueError(f"Invalid padding value: {part_value}")
+            part_value = part_value.strip()
+            # percentages are checked up front so they don't go through a failed int() parse
+            if part_value.endswith("%"):
+                parts.append(part_value)
+            else:
+                parts.append(BoxValues._parse_int_part(part_value))
 
         if len(parts) == 1:
             # If only one value is provided, apply to all sides
@@ -63,3 +60,10 @@ class BoxValues:
                 "Expected: 1 (all-sides), 2 (top/bottom, left/right) "
                 "or 4 (top, right, bottom, left)values of int or percentages. e.g. 10px, 20%"
             )
+
+    @staticmethod
+    def _parse_int_part(part_value: str) -> int:
+        try:
+            return int(part_value)
+        except ValueError:
+            raise BoxValueError(f"Invalid padding value: {part_value}") from None
@@ -239,18 +239,18 @@ class GeneratedImage:
         # If we have initial metadata from a source image, merge it
         if self.init_metadata and (old_exif := self.init_metadata.get("exif")):
             # 1. If we don't have a prompt (e.g. SeedVR2), use the original prompt
-            if not metadata.get("prompt") and old_exif.get("prompt"):
-                metadata["prompt"] = old_exif.get("prompt")
+            if not metadata["prompt"] and (old_prompt := old_exif.get("prompt")):
+                metadata["prompt"] = old_prompt
 
             # 2. If we don't have a negative prompt, use the original one
-            if not metadata.get("negative_prompt") and old_exif.get("negative_prompt"):
-                metadata["negative_prompt"] = old_exif.get("negative_prompt")
+            if not metadata["negative_prompt"] and (old_negative_prompt := old_exif.get("negative_prompt")):
+                metadata["negative_prompt"] = old_negative_prompt
 
             # 3. Store original dimensions
-            if old_exif.get("width") and old_exif.get("width") != self.width:
-                metadata["original_width"] = old_exif.get("width")
-            if old_exif.get("height") and old_exif.get("height") != self.height:
-                metadata["original_height"] = old_exif.get("height")
+            if (old_width := old_exif.get("width")) and old_width != self.width:
+                metadata["original_width"] = old_width
+            if (old_height := old_exif.get("height")) and old_height != self.height:
+                metadata["original_height"] = old_height
 
             # 4. Carry over other metadata that doesn't conflict and is useful
             fields_to_carry = [
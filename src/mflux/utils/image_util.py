@@ -144,11 +144,21 @@ class ImageUtil:
         return array
 
     @staticmethod
-    def load_image(image_or_path: PIL.Image.Image | StrOrBytesPath) -> PIL.Image.Image:
+    def load_image(
+        image_or_path: PIL.Image.Image | StrOrBytesPath,
+        draft_size: tuple[int, int] | None = None,
+    ) -> PIL.Image.Image:
         if isinstance(image_or_path, PIL.Image.Image):
             return image_or_path.convert("RGB")
-        else:
-            return PIL.Image.open(image_or_path).convert("RGB")
+        image = PIL.Image.open(image_or_path)
+        if draft_size is not None:
+            # JPEGs decode at the smallest DCT scale still covering draft_size (no-op for other formats)
+            image.draft("RGB", draft_size)
+        if image.mode == "RGB":
+            # convert() to the same mode would copy the whole decoded raster
+            image.load()
+            return image
+        return image.convert("RGB")
 
     @staticmethod
     def expand_image(
@@ -237,8 +247,9 @@ class ImageUtil:
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Save image without metadata first
-            image.save(file_path)
+            # Attach every metadata format up front so the image is encoded exactly once
+            save_kwargs = ImageUtil._metadata_save_kwargs(metadata, file_path) if metadata is not None else {}
+            image.save(file_path, **save_kwargs)
             log.info(f"Image saved successfully at: {file_path}")
 
             # Export metadata to a dedicated sidecar path so it never
@@ -248,40 +259,43 @@ class ImageUtil:
                 with open(metadata_path, "w") as json_file:
                     json.dump(metadata, json_file, indent=4)
 
-            # Embed metadata in multiple formats for maximum compatibility
-            if metadata is not None:
-                ImageUtil._embed_metadata(metadata, file_path)
-                MetadataBuilder.embed_metadata(metadata, file_path)
+            if save_kwargs:
                 log.info(f"Metadata embedded successfully at: {file_path}")
         except Exception as e:  # noqa: BLE001
             log.error(f"Error saving image: {e}")
 
     @staticmethod
-    def _embed_metadata(metadata: dict, path: str | Path) -> None:
+    def _metadata_save_kwargs(metadata: dict, path: Path) -> dict:
+        save_kwargs = {}
         try:
-            # Convert metadata dictionary to a string
-            metadata_str = json.dumps(metadata)
-
-            # Convert the string to bytes (using UTF-8 encoding)
-            # Add the ASCII character code prefix required by EXIF spec
-            user_comment_bytes = b"ASCII\x00\x00\x00" + metadata_str.encode("utf-8")
+            save_kwargs["exif"] = ImageUtil._build_exif(metadata)
+        except Exception as e:  # noqa: BLE001
+            log.error(f"Error embedding EXIF metadata: {e}")
 
-            # Define the UserComment tag ID
-            USER_COMMENT_TAG_ID = 0x9286
+        if path.suffix.lower() != ".png":
+            log.warning(f"XMP/IPTC metadata embedding is only supported for PNG files, skipping: {path}")
+            return save_kwargs
+        try:
+            save_kwargs["pnginfo"] = MetadataBuilder.build_pnginfo(metadata)
+        except Exception as e:  # noqa: BLE001
+            log.error(f"Error embedding XMP/IPTC metadata: {e}")
+        return save_kwargs
 
-            # Create a piexif-compatible dictionary structure
-            exif_piexif_dict = {"Exif": {USER_COMMENT_TAG_ID: user_comment_bytes}}
+    @staticmethod
+    def _build_exif(metadata: dict) -> bytes:
+        # Convert metadata dictionary to a string
+        metadata_str = json.dumps(metadata)
 
-            # Load the image and embed the EXIF data
-            image = PIL.Image.open(path)
-            exif_bytes = piexif.dump(exif_piexif_dict)
-            image.info["exif"] = exif_bytes
+        # Convert the string to bytes (using UTF-8 encoding)
+        # Add the ASCII character code prefix required by EXIF spec
+        user_comment_bytes = b"ASCII\x00\x00\x00" + metadata_str.encode("utf-8")
 
-            # Save the image with metadata
-            image.save(path, exif=exif_bytes)
+        # Define the UserComment tag ID
+        USER_COMMENT_TAG_ID = 0x9286
 
-        except Exception as e:  # noqa: BLE001
-            log.error(f"Error embedding EXIF metadata: {e}")
+        # Create a piexif-compatible dictionary structure
+        exif_piexif_dict = {"Exif": {USER_COMMENT_TAG_ID: user_comment_bytes}}
+        return piexif.dump(exif_piexif_dict)
 
     @staticmethod
     def preprocess_for_model(
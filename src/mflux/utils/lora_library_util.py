@@ -67,25 +67,21 @@ Examples:
         # Sort by basename for consistent output
         sorted_items = sorted(lora_registry.items())
 
-        # Print all discovered LoRAs
-        print("Discovered LoRA files:")
-        print("-" * 80)
-        for basename, full_path in sorted_items:
-            print(f"{basename} -> {full_path}")
+        # Print all discovered LoRAs in one write rather than one print per file
+        lines = ["Discovered LoRA files:", "-" * 80]
+        lines.extend(f"{basename} -> {full_path}" for basename, full_path in sorted_items)
+        print("\n".join(lines))
 
         # Calculate statistics per top-level directory
+        # Resolve each library path once instead of once per (file, library path) pair
+        resolved_paths = [(str(lib_path), lib_path.resolve()) for lib_path in valid_paths]
         stats = defaultdict(int)
         for full_path in lora_registry.values():
             # Find which library path this file belongs to
-            for lib_path in valid_paths:
-                try:
-                    # Check if full_path is relative to lib_path
-                    full_path.relative_to(lib_path.resolve())
-                    stats[str(lib_path)] += 1
+            for lib_name, resolved_lib_path in resolved_paths:
+                if full_path.is_relative_to(resolved_lib_path):
+                    stats[lib_name] += 1
                     break
-                except ValueError:
-                    # Not relative to this lib_path, continue
-                    continue
 
         # Print summary
         print("-" * 80)
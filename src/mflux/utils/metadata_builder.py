@@ -2,7 +2,7 @@ import json
 import logging
 from pathlib import Path
 
-import PIL.Image
+from PIL import PngImagePlugin
 
 log = logging.getLogger(__name__)
 
@@ -22,51 +22,18 @@ class MetadataBuilder:
             return False
 
     @staticmethod
-    def embed_metadata(metadata: dict, path: str | Path) -> None:
-        # Check if file is PNG format
-        path_obj = Path(path) if isinstance(path, str) else path
-        if path_obj.suffix.lower() != ".png":
-            log.warning(f"XMP/IPTC metadata embedding is only supported for PNG files, skipping: {path_obj}")
-            return
-
-        try:
-            from PIL import PngImagePlugin
-
-            # Load the image preserving existing metadata
-            image = PIL.Image.open(path)
-
-            # Get existing PNG info to preserve it
-            existing_info = image.info if hasattr(image, "info") else {}
-
-            # Preserve existing EXIF separately (if it exists)
-            existing_exif = existing_info.get("exif")
-
-            # Create new PngInfo preserving existing data
-            pnginfo = PngImagePlugin.PngInfo()
-
-            # Copy existing metadata
-            for key, value in existing_info.items():
-                if key not in ["XML:com.adobe.xmp", "IPTC", "exif"]:  # Handle these separately
-                    pnginfo.add_text(key, str(value))
-
-            # Build XMP and IPTC metadata using builder methods
-            xmp_packet = MetadataBuilder.build_xmp_packet(metadata)
-            iptc_binary = MetadataBuilder.build_iptc_binary(metadata)
-
-            # Add XMP and IPTC to PNG info
-            pnginfo.add_text("XML:com.adobe.xmp", xmp_packet)
-            if iptc_binary:
-                pnginfo.add_text("IPTC", iptc_binary.hex())
-
-            # Save preserving ALL existing metadata + adding XMP/IPTC
-            # Pass exif separately to preserve it correctly
-            if existing_exif:
-                image.save(path, pnginfo=pnginfo, exif=existing_exif)
-            else:
-                image.save(path, pnginfo=pnginfo)
-
-        except Exception as e:  # noqa: BLE001
-            log.error(f"Error embedding XMP/IPTC metadata: {e}")
+    def build_pnginfo(metadata: dict) -> PngImagePlugin.PngInfo:
+        pnginfo = PngImagePlugin.PngInfo()
+
+        # Build XMP and IPTC metadata using builder methods
+        xmp_packet = MetadataBuilder.build_xmp_packet(metadata)
+        iptc_binary = MetadataBuilder.build_iptc_binary(metadata)
+
+        # Add XMP and IPTC to PNG info
+        pnginfo.add_text("XML:com.adobe.xmp", xmp_packet)
+        if iptc_binary:
+            pnginfo.add_text("IPTC", iptc_binary.hex())
+        return pnginfo
 
     @staticmethod
     def build_xmp_packet(metadata: dict) -> str:
@@ -340,11 +340,11 @@ def test_guidance_arg(mflux_generate_parser, mflux_generate_minimal_argv, base_m
     # test metadata config accepted
     with patch('sys.argv', mflux_generate_minimal_argv + ['--config-from-metadata', metadata_file.as_posix()]):  # fmt: off
         args = mflux_generate_parser.parse_args()
-        assert args.guidance == pytest.approx(4.2)
+        assert args.guidance == 4.2
     # test CLI override
     with patch('sys.argv', mflux_generate_minimal_argv + ['--guidance', '5.0', '--config-from-metadata', metadata_file.as_posix()]):  # fmt: off
         args = mflux_generate_parser.parse_args()
-        assert args.guidance == pytest.approx(5.0)
+        assert args.guidance == 5.0
 
 
 @pytest.mark.fast
@@ -463,7 +463,7 @@ def test_lora_args(mflux_generate_parser, mflux_generate_minimal_argv, base_meta
         with patch('sys.argv', mflux_generate_minimal_argv + ['--config-from-metadata', metadata_file.as_posix()]):  # fmt: off
             args = mflux_generate_parser.parse_args()
             assert args.lora_paths == test_paths
-            assert args.lora_scales == [pytest.approx(0.3), pytest.approx(0.7)]
+            assert args.lora_scales == [0.3, 0.7]
 
         # test CLI override that merges CLI loras and config file loras
         new_loras = [
@@ -479,7 +479,7 @@ def test_lora_args(mflux_generate_parser, mflux_generate_minimal_argv, base_meta
             assert len(args.lora_paths) == 4
             assert args.lora_paths == test_paths + new_loras[1:3]
             assert len(args.lora_scales) == 4
-            assert args.lora_scales == [pytest.approx(v) for v in [0.3, 0.7, 0.1, 0.9]]
+            assert args.lora_scales == [0.3, 0.7, 0.1, 0.9]
 
 
 @pytest.mark.fast
@@ -563,7 +563,7 @@ def test_controlnet_args(mflux_generate_controlnet_parser, mflux_generate_contro
     with patch('sys.argv', mflux_generate_controlnet_minimal_argv + ['--config-from-metadata', metadata_file.as_posix()]):  # fmt: off
         args = mflux_generate_controlnet_parser.parse_args()
         assert args.controlnet_image_path == test_path
-        assert args.controlnet_strength == pytest.approx(0.48)
+        assert args.controlnet_strength == 0.48
         assert args.controlnet_save_canny is False
 
     # test CLI override
@@ -577,7 +577,7 @@ def test_controlnet_args(mflux_generate_controlnet_parser, mflux_generate_contro
     with patch('sys.argv', mflux_generate_controlnet_minimal_argv + override_cnet + ['--config-from-metadata', metadata_file.as_posix()]):  # fmt: off
         args = mflux_generate_controlnet_parser.parse_args()
         assert args.controlnet_image_path == "/some/lora/2.safetensors"
-        assert args.controlnet_strength == pytest.approx(0.85)
+        assert args.controlnet_strength == 0.85
         assert args.controlnet_save_canny is True
 
     # test controlnet_save_canny is False when not specified
@@ -625,7 +625,7 @@ def test_fill_args(mflux_fill_parser, mflux_fill_minimal_argv):
     custom_argv = mflux_fill_minimal_argv + ["--guidance", "30", "--steps", "20", "--height", "512", "--width", "512"]
     with patch("sys.argv", custom_argv):
         args = mflux_fill_parser.parse_args()
-        assert args.guidance == pytest.approx(30.0)
+        assert args.guidance == 30.0
         assert args.steps == 20
         assert args.height == 512
         assert args.width == 512
@@ -756,15 +756,15 @@ def test_redux_args(mflux_redux_parser, mflux_redux_minimal_argv):
         args = mflux_redux_parser.parse_args()
         assert len(args.redux_image_paths) == 2
         assert len(args.redux_image_strengths) == 2
-        assert args.redux_image_strengths[0] == pytest.approx(0.8)
-        assert args.redux_image_strengths[1] == pytest.approx(0.5)
+        assert args.redux_image_strengths[0] == 0.8
+        assert args.redux_image_strengths[1] == 0.5
 
     # Test with single redux_image_strength
     with patch("sys.argv", mflux_redux_minimal_argv + ["--redux-image-strengths", "0.3"]):
         args = mflux_redux_parser.parse_args()
         assert len(args.redux_image_paths) == 2
         assert len(args.redux_image_strengths) == 1
-        assert args.redux_image_strengths[0] == pytest.approx(0.3)
+        assert args.redux_image_strengths[0] == 0.3
 
     # Test with model argument
     with patch("sys.argv", mflux_redux_minimal_argv + ["--model", "dev"]):
@@ -941,7 +941,7 @@ def test_qwen_args(mflux_qwen_parser, mflux_qwen_minimal_argv):
         args = mflux_qwen_parser.parse_args()
         assert args.prompt == "a beautiful sunset"
         assert args.image_path == Path("input.png")
-        assert args.image_strength == pytest.approx(0.5)
+        assert args.image_strength == 0.5
 
     # Test with quantization
     with patch("sys.argv", mflux_qwen_minimal_argv + ["--quantize", "8"]):
@@ -1266,7 +1266,7 @@ def test_z_image_turbo_args(mflux_z_image_turbo_parser, mflux_z_image_turbo_mini
     with patch("sys.argv", mflux_z_image_turbo_minimal_argv + ["--image-path", "input.png", "--image-strength", "0.6"]):
         args = mflux_z_image_turbo_parser.parse_args()
         assert args.image_path == Path("input.png")
-        assert args.image_strength == pytest.approx(0.6)
+        assert args.image_strength == 0.6
 
     # Mock LoraResolution.resolve to bypass file validation for test purposes
     with patch("mflux.cli.parser.parsers.LoraResolution.resolve", side_effect=lambda x: x):
@@ -1277,7 +1277,7 @@ def test_z_image_turbo_args(mflux_z_image_turbo_parser, mflux_z_image_turbo_mini
         ):
             args = mflux_z_image_turbo_parser.parse_args()
             assert args.lora_paths == ["some/lora.safetensors"]
-            assert args.lora_scales == [pytest.approx(0.8)]
+            assert args.lora_scales == [0.8]
 
 
 # ============================================================================
@@ -1328,7 +1328,7 @@ def test_ernie_image_args(mflux_ernie_image_parser, mflux_ernie_image_minimal_ar
     with patch("sys.argv", mflux_ernie_image_minimal_argv):
         args = mflux_ernie_image_parser.parse_args()
         assert args.prompt == "a bicycle on a beach"
-        assert args.guidance == pytest.approx(4.0)
+        assert args.guidance == 4.0
         assert mflux_ernie_image_parser.supports_dimension_scale_factor is True
         assert isinstance(args.width, ScaleFactor)
         assert isinstance(args.height, ScaleFactor)
@@ -1337,12 +1337,12 @@ def test_ernie_image_args(mflux_ernie_image_parser, mflux_ernie_image_minimal_ar
 
     with patch("sys.argv", mflux_ernie_image_minimal_argv + ["--guidance", "3.0"]):
         args = mflux_ernie_image_parser.parse_args()
-        assert args.guidance == pytest.approx(3.0)
+        assert args.guidance == 3.0
 
     with patch("sys.argv", mflux_ernie_image_minimal_argv + ["--image-path", "input.png", "--image-strength", "0.7"]):
         args = mflux_ernie_image_parser.parse_args()
         assert args.image_path == Path("input.png")
-        assert args.image_strength == pytest.approx(0.7)
+        assert args.image_strength == 0.7
 
 
 @pytest.mark.fast
@@ -1357,19 +1357,21 @@ def test_ernie_image_turbo_args(mflux_ernie_image_turbo_parser, mflux_ernie_imag
 
     with patch("sys.argv", mflux_ernie_image_turbo_minimal_argv + ["--guidance", "1.0"]):
         args = mflux_ernie_image_turbo_parser.parse_args()
-        assert args.guidance == pytest.approx(1.0)
+        assert args.guidance == 1.0
 
 
 @pytest.mark.fast
 def test_ernie_image_turbo_rejects_non_unit_guidance(mflux_ernie_image_turbo_minimal_argv):
     from mflux.models.ernie_image.cli import ernie_image_turbo_generate as turbo_cli
 
-    with patch("sys.argv", mflux_ernie_image_turbo_minimal_argv + ["--guidance", "4.0"]):
-        with patch.object(turbo_cli, "ErnieImage"):
-            with patch.object(turbo_cli.CallbackManager, "register_callbacks", return_value=None):
-                with pytest.raises(SystemExit) as exc_info:
-                    turbo_cli.main()
-                assert exc_info.value.code == 2
+    with (
+        patch("sys.argv", mflux_ernie_image_turbo_minimal_argv + ["--guidance", "4.0"]),
+        patch.object(turbo_cli, "ErnieImage"),
+        patch.object(turbo_cli.CallbackManager, "register_callbacks", return_value=None),
+    ):
+        with pytest.raises(SystemExit) as exc_info:
+            turbo_cli.main()
+        assert exc_info.value.code == 2
 
 
 # ============================================================================
@@ -1483,7 +1485,7 @@ def test_kontext_args(mflux_kontext_parser, mflux_kontext_minimal_argv):
     with patch("sys.argv", mflux_kontext_minimal_argv + ["--steps", "15", "--guidance", "3.5"]):
         args = mflux_kontext_parser.parse_args()
         assert args.steps == 15
-        assert args.guidance == pytest.approx(3.5)
+        assert args.guidance == 3.5
 
 
 # ============================================================================
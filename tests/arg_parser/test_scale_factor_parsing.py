@@ -48,6 +48,12 @@ def test_plain_integer_dimensions(generic_parser):
         assert args.dim == 1024
 
 
+@pytest.mark.fast
+@pytest.mark.parametrize(("raw", "expected"), [("0768", 768), (" 512 ", 512), ("+256", 256), ("1_024", 1024)])
+def test_non_plain_integers_still_parse_as_int(raw, expected):
+    assert int_or_special_value(raw) == expected
+
+
 @pytest.mark.fast
 def test_invalid_scale_factor_format(generic_parser):
     # Invalid format without 'x'
@@ -70,14 +70,15 @@ def test_seedvr2_multiple_images_and_seeds(seedvr2_upscale_parser):
 
 
 @pytest.mark.fast
-def test_seedvr2_quantize_choices(seedvr2_upscale_parser, seedvr2_upscale_minimal_argv):
-    # Valid choices
-    for q in ["4", "8"]:
-        with patch("sys.argv", seedvr2_upscale_minimal_argv + ["--quantize", q]):
-            args = seedvr2_upscale_parser.parse_args()
-            assert args.quantize == int(q)
-
-    # Invalid choice
+@pytest.mark.parametrize("q", ["4", "8"])
+def test_seedvr2_quantize_choices(seedvr2_upscale_parser, seedvr2_upscale_minimal_argv, q):
+    with patch("sys.argv", seedvr2_upscale_minimal_argv + ["--quantize", q]):
+        args = seedvr2_upscale_parser.parse_args()
+        assert args.quantize == int(q)
+
+
+@pytest.mark.fast
+def test_seedvr2_quantize_rejects_invalid_choice(seedvr2_upscale_parser, seedvr2_upscale_minimal_argv):
     with patch("sys.argv", seedvr2_upscale_minimal_argv + ["--quantize", "16"]):
         with pytest.raises(SystemExit):
             seedvr2_upscale_parser.parse_args()
@@ -185,3 +186,15 @@ def test_seedvr2_model_resolution_prefers_local_3b_when_directory_contains_only_
     )
     assert "seedvr2-3b" in model_config.aliases
     assert model_path == str(model_dir)
+
+
+@pytest.mark.fast
+def test_seedvr2_expands_directory_without_probing_non_image_files(tmp_path):
+    image = tmp_path / "photo.PNG"
+    image.touch()
+    for index in range(5):
+        (tmp_path / f"caption_{index}.txt").touch()
+    (tmp_path / "folder.jpg").mkdir()
+
+    with patch.object(Path, "is_file", side_effect=AssertionError("Path.is_file should not be called")):
+        assert _expand_image_paths([tmp_path]) == [image]
@@ -31,12 +31,14 @@ def test_prompt_from_stdin(mflux_generate_parser):
     stdin_content = "A beautiful sunset over the ocean"
 
     # Simulate stdin input
-    with patch("sys.stdin", StringIO(stdin_content)):
-        with patch("sys.argv", ["mflux-generate", "--prompt", "-", "--model", "dev"]):
-            args = mflux_generate_parser.parse_args()
+    with (
+        patch("sys.stdin", StringIO(stdin_content)),
+        patch("sys.argv", ["mflux-generate", "--prompt", "-", "--model", "dev"]),
+    ):
+        args = mflux_generate_parser.parse_args()
 
-            # The parser returns the raw args, read_prompt handles stdin
-            assert args.prompt == "-"
+        # The parser returns the raw args, read_prompt handles stdin
+        assert args.prompt == "-"
 
 
 @pytest.mark.fast
@@ -54,11 +56,13 @@ def test_prompt_stdin_with_whitespace(mflux_generate_parser):
     stdin_content = "\n\n   A prompt with whitespace   \n\n"
     expected_prompt = "A prompt with whitespace"
 
-    with patch("sys.stdin", StringIO(stdin_content)):
-        with patch("sys.argv", ["mflux-generate", "--prompt", "-", "--model", "dev"]):
-            args = mflux_generate_parser.parse_args()
-            effective_prompt = PromptUtil.read_prompt(args)
-            assert effective_prompt == expected_prompt
+    with (
+        patch("sys.stdin", StringIO(stdin_content)),
+        patch("sys.argv", ["mflux-generate", "--prompt", "-", "--model", "dev"]),
+    ):
+        args = mflux_generate_parser.parse_args()
+        effective_prompt = PromptUtil.read_prompt(args)
+        assert effective_prompt == expected_prompt
 
 
 @pytest.mark.fast
@@ -69,8 +73,10 @@ def test_prompt_file_takes_precedence_over_stdin(mflux_generate_parser, temp_out
     prompt_file.write_text(file_prompt)
     stdin_content = "This should not be used because --prompt is not provided in the command."
 
-    with patch("sys.stdin", StringIO(stdin_content)):
-        with patch("sys.argv", ["mflux-generate", "--prompt-file", str(prompt_file), "--model", "dev"]):
-            args = mflux_generate_parser.parse_args()
-            effective_prompt = PromptUtil.read_prompt(args)
-            assert effective_prompt == file_prompt
+    with (
+        patch("sys.stdin", StringIO(stdin_content)),
+        patch("sys.argv", ["mflux-generate", "--prompt-file", str(prompt_file), "--model", "dev"]),
+    ):
+        args = mflux_generate_parser.parse_args()
+        effective_prompt = PromptUtil.read_prompt(args)
+        assert effective_prompt == file_prompt
@@ -1,3 +1,4 @@
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -72,3 +73,43 @@ def test_battery_saver_equal_to_limit():
 
         # Check the exception message contains the correct limit and percentage
         assert "10%" in str(excinfo.value)
+
+
+@pytest.mark.fast
+def test_battery_percentage_is_reused_within_ttl():
+    with (
+        patch.object(BatterySaver, "_read_battery_percentage", return_value=50) as mock_read,
+        patch("time.monotonic", side_effect=[100.0, 110.0, 100.0 + BatterySaver.BATTERY_READING_TTL_SECONDS]),
+    ):
+        battery_saver = BatterySaver()
+
+        assert battery_saver._get_battery_percentage() == 50
+        assert battery_saver._get_battery_percentage() == 50
+        assert mock_read.call_count == 1
+
+        assert battery_saver._get_battery_percentage() == 50
+        assert mock_read.call_count == 2
+
+
+@pytest.mark.fast
+def test_machine_model_is_read_from_sysctl_without_system_profiler():
+    with (
+        patch.object(BatterySaver, "_machine_model", None),
+        patch(
+            "mflux.callbacks.instances.battery_saver.AppleSiliconUtil.read_sysctl_string",
+            return_value="MacBookPro18,3",
+        ),
+        patch("subprocess.run", side_effect=AssertionError("system_profiler should not run")),
+    ):
+        assert BatterySaver._get_machine_model() == "MacBookPro18,3"
+
+
+@pytest.mark.fast
+def test_battery_probe_timeout_disables_the_check():
+    with (
+        patch("platform.uname", return_value=MagicMock(system="Darwin")),
+        patch.object(BatterySaver, "_is_machine_battery_powered", return_value=True),
+        patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="pmset", timeout=5.0)) as mock_run,
+    ):
+        assert BatterySaver()._read_battery_percentage() is None
+        assert mock_run.call_args.kwargs["timeout"] == BatterySaver.PROBE_TIMEOUT_SECONDS
@@ -13,9 +13,9 @@ def test_register_memory_saver_sets_mlx_cache_limit_without_low_ram():
     model = SimpleNamespace(callbacks=MagicMock())
 
     with (
-        patch("mflux.callbacks.callback_manager.mx.set_cache_limit") as mock_set_cache_limit,
-        patch("mflux.callbacks.callback_manager.mx.clear_cache") as mock_clear_cache,
-        patch("mflux.callbacks.callback_manager.mx.reset_peak_memory") as mock_reset_peak_memory,
+        patch("mflux.callbacks.callback_manager.mx.set_cache_limit", autospec=True) as mock_set_cache_limit,
+        patch("mflux.callbacks.callback_manager.mx.clear_cache", autospec=True) as mock_clear_cache,
+        patch("mflux.callbacks.callback_manager.mx.reset_peak_memory", autospec=True) as mock_reset_peak_memory,
     ):
         memory_saver = CallbackManager._register_memory_saver(args=args, model=model)
 
@@ -46,12 +46,17 @@ def test_register_memory_saver_uses_mlx_cache_limit_for_low_ram_mode():
     model = SimpleNamespace(callbacks=MagicMock())
     mocked_memory_saver = object()
 
-    with patch("mflux.callbacks.callback_manager.MemorySaver", return_value=mocked_memory_saver) as mock_memory_saver:
+    with patch(
+        "mflux.callbacks.callback_manager.MemorySaver", autospec=True, return_value=mocked_memory_saver
+    ) as mock_memory_saver:
         memory_saver = CallbackManager._register_memory_saver(args=args, model=model)
 
     assert memory_saver is mocked_memory_saver
-    _, kwargs = mock_memory_saver.call_args
-    assert kwargs["cache_limit_bytes"] == int(3.0 * (1000**3))
-    assert kwargs["num_seeds"] == 2
-    assert kwargs["keep_transformer"] is True
+    mock_memory_saver.assert_called_once_with(
+        model=model,
+        keep_transformer=True,
+        cache_limit_bytes=int(3.0 * (1000**3)),
+        args=args,
+        num_seeds=2,
+    )
     model.callbacks.register.assert_called_once_with(mocked_memory_saver)
@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 import pytest
 
+from mflux.callbacks.callback_registry import CallbackRegistry
 from mflux.callbacks.instances.memory_saver import MemorySaver
 from mflux.models.common.config.config import Config
 from mflux.models.common.config.model_config import ModelConfig
@@ -31,9 +32,9 @@ def test_memory_saver_skips_mlx_cache_setup_when_cache_limit_is_none():
     model = _EncoderModel()
 
     with (
-        patch("mflux.callbacks.instances.memory_saver.mx.set_cache_limit") as mock_set_cache_limit,
-        patch("mflux.callbacks.instances.memory_saver.mx.clear_cache") as mock_clear_cache,
-        patch("mflux.callbacks.instances.memory_saver.mx.reset_peak_memory") as mock_reset_peak_memory,
+        patch("mflux.callbacks.instances.memory_saver.mx.set_cache_limit", autospec=True) as mock_set_cache_limit,
+        patch("mflux.callbacks.instances.memory_saver.mx.clear_cache", autospec=True) as mock_clear_cache,
+        patch("mflux.callbacks.instances.memory_saver.mx.reset_peak_memory", autospec=True) as mock_reset_peak_memory,
     ):
         MemorySaver(model=model, cache_limit_bytes=None)
 
@@ -78,11 +79,35 @@ def test_call_after_loop_clears_cache_when_keep_transformer_true():
     saver = MemorySaver(model=model, keep_transformer=True, cache_limit_bytes=None)
 
     with (
-        patch("mflux.callbacks.instances.memory_saver.gc.collect") as mock_gc_collect,
-        patch("mflux.callbacks.instances.memory_saver.mx.clear_cache") as mock_clear_cache,
+        patch("mflux.callbacks.instances.memory_saver.gc.collect", autospec=True) as mock_gc_collect,
+        patch("mflux.callbacks.instances.memory_saver.mx.clear_cache", autospec=True) as mock_clear_cache,
     ):
         saver.call_after_loop(seed=1, prompt="a cat", latents=None, config=_config())
 
     mock_gc_collect.assert_called_once()
     mock_clear_cache.assert_called_once()
     assert model.transformer is not None
+
+
+@pytest.mark.fast
+def test_call_before_loop_skips_gc_when_encoders_already_released():
+    model = _EncoderModel(prompt_cache={"a cat": object()})
+    saver = MemorySaver(model=model, cache_limit_bytes=None, num_seeds=3)
+    saver.call_before_loop(seed=1, prompt="a cat", latents=None, config=_config())
+
+    with patch("mflux.callbacks.instances.memory_saver.gc.collect", autospec=True) as mock_gc_collect:
+        saver.call_before_loop(seed=2, prompt="a cat", latents=None, config=_config())
+
+    mock_gc_collect.assert_not_called()
+
+
+@pytest.mark.fast
+def test_memory_saver_is_not_dispatched_per_denoising_step():
+    registry = CallbackRegistry()
+    saver = MemorySaver(model=_EncoderModel(), cache_limit_bytes=None)
+
+    registry.register(saver)
+
+    assert registry.in_loop_callbacks() == []
+    assert registry.before_loop_callbacks() == [saver]
+    assert registry.after_loop_callbacks() == [saver]
@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from mflux.models.common.weights.loading.weight_loader import WeightLoader
+
+
+def _cached_snapshot(cache_dir, *file_names):
+    snapshot = cache_dir / "models--org--controlnet" / "snapshots" / "abc123"
+    snapshot.mkdir(parents=True)
+    for name in file_names:
+        (snapshot / name).touch()
+    return snapshot
+
+
+@pytest.mark.fast
+def test_load_single_uses_complete_cached_snapshot(tmp_path):
+    snapshot = _cached_snapshot(tmp_path, "config.json", "controlnet.safetensors")
+
+    with (
+        patch("mflux.models.common.resolution.path_resolution.HF_HUB_CACHE", str(tmp_path)),
+        patch("huggingface_hub.snapshot_download") as mock_download,
+        patch.object(WeightLoader, "_load_component", return_value=({}, None, None)) as mock_load,
+    ):
+        WeightLoader.load_single(component=SimpleNamespace(name="controlnet"), repo_id="org/controlnet")
+
+    mock_download.assert_not_called()
+    assert mock_load.call_args.args[0] == snapshot
+
+
+@pytest.mark.fast
+def test_load_single_downloads_when_weights_are_missing_from_cache(tmp_path):
+    _cached_snapshot(tmp_path, "config.json")
+    downloaded = tmp_path / "downloaded"
+
+    with (
+        patch("mflux.models.common.resolution.path_resolution.HF_HUB_CACHE", str(tmp_path)),
+        patch("huggingface_hub.snapshot_download", return_value=str(downloaded)) as mock_download,
+        patch.object(WeightLoader, "_load_component", return_value=({}, None, None)) as mock_load,
+    ):
+        WeightLoader.load_single(component=SimpleNamespace(name="controlnet"), repo_id="org/controlnet")
+
+    mock_download.assert_called_once_with(repo_id="org/controlnet", allow_patterns=["*.safetensors", "config.json"])
+    assert mock_load.call_args.args[0] == downloaded
@@ -0,0 +1,21 @@
+import pytest
+
+from mflux.models.common.weights.mapping.weight_mapper import WeightMapper
+
+
+@pytest.mark.fast
+def test_detect_num_blocks_covers_double_and_single_blocks():
+    weights = {
+        "transformer_blocks.0.attn.to_q.weight": None,
+        "transformer_blocks.18.attn.to_q.weight": None,
+        "single_transformer_blocks.37.proj_out.weight": None,
+        "x_embedder.weight": None,
+    }
+
+    assert WeightMapper._detect_num_blocks(weights) == 38
+
+
+@pytest.mark.fast
+def test_detect_num_layers_defaults_without_layer_keys():
+    assert WeightMapper._detect_num_layers({"model.layers.5.mlp.up_proj.weight": None}) == 6
+    assert WeightMapper._detect_num_layers({"lm_head.weight": None}) == 28
@@ -113,3 +113,23 @@ def test_build_rgba_composite_image_returns_rgba(tmp_path):
 
     assert rgba.mode == "RGBA"
     assert rgba.size == (32, 24)
+
+
+def test_composite_mask_reuses_images_already_in_target_mode(monkeypatch):
+    image = Image.new("RGB", (16, 16), (255, 0, 0))
+    mask = Image.new("L", (16, 16), 255)
+    composited = []
+    real_composite = Image.composite
+    monkeypatch.setattr(
+        fibo_edit_util_module.Image,
+        "composite",
+        lambda image1, image2, mask_image: (
+            composited.append((image2, mask_image)) or real_composite(image1, image2, mask_image)
+        ),
+    )
+
+    result = FiboEditUtil._composite_mask_on_image(mask=mask, image=image)
+
+    assert result.getpixel((0, 0)) == (128, 128, 128)
+    assert composited[0][0] is image
+    assert composited[0][1] is mask
@@ -4,6 +4,7 @@ import PIL.Image
 import pytest
 
 from mflux.utils.image_util import ImageUtil
+from mflux.utils.metadata_reader import MetadataReader
 
 
 @pytest.fixture
@@ -200,3 +201,69 @@ def test_to_array_with_mask():
     assert mask_array[0, 0, 0, 99] == 0.0
     assert mask_array[0, 0, 99, 0] == 0.0
     assert mask_array[0, 0, 99, 99] == 0.0
+
+
+@pytest.mark.fast
+def test_load_image_with_draft_size_decodes_jpeg_at_reduced_scale(tmp_path):
+    path = tmp_path / "large.jpg"
+    PIL.Image.new("RGB", (2048, 1536), color="blue").save(path, format="JPEG")
+
+    full = ImageUtil.load_image(path)
+    drafted = ImageUtil.load_image(path, draft_size=(512, 384))
+
+    assert full.size == (2048, 1536)
+    assert drafted.size == (512, 384)
+    assert drafted.mode == "RGB"
+
+
+@pytest.mark.fast
+def test_load_image_with_draft_size_never_goes_below_requested_size(tmp_path):
+    path = tmp_path / "large.jpg"
+    PIL.Image.new("RGB", (2048, 1536), color="blue").save(path, format="JPEG")
+
+    drafted = ImageUtil.load_image(path, draft_size=(1000, 700))
+
+    assert drafted.width >= 1000 and drafted.height >= 700
+
+
+@pytest.mark.fast
+def test_load_image_from_path_only_converts_non_rgb_images(tmp_path, monkeypatch):
+    rgb_path = tmp_path / "rgb.png"
+    rgba_path = tmp_path / "rgba.png"
+    PIL.Image.new("RGB", (32, 32), color="red").save(rgb_path)
+    PIL.Image.new("RGBA", (32, 32), color="red").save(rgba_path)
+    converted_modes = []
+    original_convert = PIL.Image.Image.convert
+
+    def tracking_convert(self, mode=None, *args, **kwargs):
+        converted_modes.append(self.mode)
+        return original_convert(self, mode, *args, **kwargs)
+
+    monkeypatch.setattr(PIL.Image.Image, "convert", tracking_convert)
+
+    rgb = ImageUtil.load_image(rgb_path)
+    rgba = ImageUtil.load_image(rgba_path)
+
+    assert rgb.mode == rgba.mode == "RGB"
+    assert rgb.getpixel((0, 0)) == (255, 0, 0)
+    assert converted_modes == ["RGBA"]
+
+
+@pytest.mark.fast
+def test_save_image_embeds_exif_and_xmp_in_a_single_encode(tmp_path, test_image, monkeypatch):
+    path = tmp_path / "out.png"
+    saves = []
+    original_save = PIL.Image.Image.save
+    monkeypatch.setattr(
+        PIL.Image.Image,
+        "save",
+        lambda self, *args, **kwargs: saves.append(args) or original_save(self, *args, **kwargs),
+    )
+
+    ImageUtil.save_image(test_image, path, metadata={"prompt": "a blue square", "seed": 7, "steps": 2})
+
+    assert len(saves) == 1
+    assert MetadataReader.read_exif_metadata(path)["prompt"] == "a blue square"
+    with PIL.Image.open(path) as saved:
+        assert "<mflux:seed>7</mflux:seed>" in saved.info["XML:com.adobe.xmp"]
+        assert "IPTC" in saved.info
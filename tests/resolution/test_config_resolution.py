@@ -92,6 +92,17 @@ class TestConfigResolutionError:
         assert "Cannot infer" in str(exc_info.value)
 
 
+class TestConfigResolutionBaseModels:
+    @pytest.mark.fast
+    def test_base_models_are_built_once_in_priority_order(self):
+        first = ConfigResolution._get_base_models()
+        second = ConfigResolution._get_base_models()
+
+        assert first is second
+        assert [m.priority for m in first] == sorted(m.priority for m in first)
+        assert all(m.base_model is None for m in first)
+
+
 class TestConfigResolutionIdeogram4:
     @pytest.mark.fast
     @pytest.mark.parametrize(
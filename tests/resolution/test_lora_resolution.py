@@ -1,3 +1,5 @@
+import os
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -6,6 +8,12 @@ from huggingface_hub.utils import LocalEntryNotFoundError
 from mflux.models.common.resolution.lora_resolution import LoraResolution
 
 
+@pytest.fixture(autouse=True)
+def isolated_resolution_state(monkeypatch):
+    monkeypatch.setattr(LoraResolution, "_hf_resolved", {})
+    monkeypatch.setattr(LoraResolution, "_registry_loaded", True)
+
+
 class TestLoraResolutionLocal:
     @pytest.mark.fast
     def test_existing_local_file(self, tmp_path):
@@ -33,10 +41,37 @@ class TestLoraResolutionRegistry:
         finally:
             LoraResolution._registry = original_registry
 
+    @pytest.mark.fast
+    def test_library_is_scanned_on_first_registry_lookup(self, tmp_path, monkeypatch):
+        (tmp_path / "lazy-style.safetensors").touch()
+        monkeypatch.setenv("LORA_LIBRARY_PATH", str(tmp_path))
+        monkeypatch.setattr(LoraResolution, "_registry", {})
+        monkeypatch.setattr(LoraResolution, "_registry_loaded", False)
+
+        with patch.object(LoraResolution, "discover_files", wraps=LoraResolution.discover_files) as discover:
+            LoraResolution.resolve(path="lazy-style")
+            LoraResolution.resolve(path="lazy-style")
+
+        discover.assert_called_once()
+
+    @pytest.mark.fast
+    def test_earlier_library_path_wins_for_duplicate_names(self, tmp_path):
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        for library in (first, second):
+            (library / "nested").mkdir(parents=True)
+            (library / "nested" / "shared.safetensors").touch()
+        (second / "only-second.safetensors").touch()
+
+        registry = LoraResolution.discover_files([first, second, tmp_path / "missing"])
+
+        assert registry["shared"] == (first / "nested" / "shared.safetensors").resolve()
+        assert registry["only-second"] == (second / "only-second.safetensors").resolve()
+
 
 class TestLoraResolutionHuggingFace:
     @pytest.mark.fast
-    @patch("mflux.models.common.resolution.lora_resolution.snapshot_download")
+    @patch("huggingface_hub.snapshot_download")
     def test_huggingface_repo_downloads_when_not_cached(self, mock_download, tmp_path):
         lora_file = tmp_path / "lora.safetensors"
         lora_file.touch()
@@ -55,7 +90,7 @@ class TestLoraResolutionHuggingFace:
         assert result == str(lora_file)
 
     @pytest.mark.fast
-    @patch("mflux.models.common.resolution.lora_resolution.snapshot_download")
+    @patch("huggingface_hub.snapshot_download")
     def test_huggingface_repo_uses_cache_when_available(self, mock_download, tmp_path):
         lora_file = tmp_path / "lora.safetensors"
         lora_file.touch()
@@ -64,12 +99,40 @@ class TestLoraResolutionHuggingFace:
 
         result = LoraResolution.resolve(path="org/lora-repo")
 
-        # Called twice with local_files_only=True (once in check, once in execute)
-        assert mock_download.call_count == 2
-        for call in mock_download.call_args_list:
-            assert call[1].get("local_files_only") is True
+        # A single cache probe resolves the file for both the check and the action
+        mock_download.assert_called_once()
+        assert mock_download.call_args[1].get("local_files_only") is True
         assert result == str(lora_file)
 
+    @pytest.mark.fast
+    @patch("huggingface_hub.snapshot_download")
+    def test_repeat_resolution_skips_cache_probes(self, mock_download, tmp_path):
+        lora_file = tmp_path / "lora.safetensors"
+        lora_file.touch()
+        mock_download.return_value = str(tmp_path)
+
+        first = LoraResolution.resolve(path="org/lora-repo")
+        calls_after_first = mock_download.call_count
+        second = LoraResolution.resolve(path="org/lora-repo")
+
+        assert first == second == str(lora_file)
+        assert mock_download.call_count == calls_after_first
+
+    @pytest.mark.fast
+    @patch("huggingface_hub.snapshot_download")
+    def test_memoized_path_is_dropped_when_file_disappears(self, mock_download, tmp_path):
+        lora_file = tmp_path / "lora.safetensors"
+        lora_file.touch()
+        mock_download.return_value = str(tmp_path)
+        LoraResolution.resolve(path="org/lora-repo")
+        lora_file.unlink()
+        mock_download.side_effect = LocalEntryNotFoundError("Not cached")
+
+        with pytest.raises(LocalEntryNotFoundError):
+            LoraResolution.resolve(path="org/lora-repo")
+
+        assert "org/lora-repo" not in LoraResolution._hf_resolved
+
     @pytest.mark.fast
     def test_collection_format_is_detected(self):
         # Collection format: "repo:filename" with a "/" in repo
@@ -78,7 +141,7 @@ class TestLoraResolutionHuggingFace:
         assert not LoraResolution._is_collection_format("local:file")
 
     @pytest.mark.fast
-    @patch("mflux.models.common.resolution.lora_resolution.snapshot_download")
+    @patch("huggingface_hub.snapshot_download")
     def test_multiple_safetensors_in_repo_raises_error(self, mock_download, tmp_path):
         # Create multiple .safetensors files in the directory
         (tmp_path / "lora_v1.safetensors").touch()
@@ -99,7 +162,7 @@ class TestLoraResolutionHuggingFace:
         assert "org/multi-lora-repo:lora_v2.safetensors" in error_msg
 
     @pytest.mark.fast
-    @patch("mflux.models.common.resolution.lora_resolution.snapshot_download")
+    @patch("huggingface_hub.snapshot_download")
     def test_multiple_safetensors_cached_raises_error(self, mock_download, tmp_path):
         # Create multiple .safetensors files in the directory
         (tmp_path / "lora_a.safetensors").touch()
@@ -114,7 +177,7 @@ class TestLoraResolutionHuggingFace:
         assert "Multiple .safetensors files found" in str(exc_info.value)
 
     @pytest.mark.fast
-    @patch("mflux.models.common.resolution.lora_resolution.snapshot_download")
+    @patch("huggingface_hub.snapshot_download")
     def test_single_safetensor_in_repo_succeeds(self, mock_download, tmp_path):
         # Create only one .safetensors file
         lora_file = tmp_path / "single-lora.safetensors"
@@ -130,6 +193,47 @@ class TestLoraResolutionHuggingFace:
         assert result == str(lora_file)
 
 
+class TestLoraResolutionCacheLink:
+    @pytest.mark.fast
+    def test_link_created_concurrently_is_reused(self, tmp_path, monkeypatch):
+        download_path = tmp_path / "snapshot"
+        download_path.mkdir()
+        source = download_path / "style.safetensors"
+        source.touch()
+        cache_path = tmp_path / "cache"
+        cache_path.mkdir()
+
+        def link_then_raise(self, target):
+            # Simulate another process winning the race between exists() and symlink_to()
+            os.symlink(target, self)
+            raise FileExistsError(str(self))
+
+        monkeypatch.setattr("pathlib.Path.symlink_to", link_then_raise)
+
+        result = LoraResolution._find_and_link_file(download_path, "style.safetensors", cache_path)
+
+        assert result == str(cache_path / "style.safetensors")
+
+    @pytest.mark.fast
+    def test_hardlinks_when_symlinks_are_unavailable(self, tmp_path, monkeypatch):
+        download_path = tmp_path / "snapshot"
+        download_path.mkdir()
+        source = download_path / "style.safetensors"
+        source.write_bytes(b"weights")
+        cache_path = tmp_path / "cache"
+        cache_path.mkdir()
+
+        def no_symlinks(self, target):
+            raise OSError("symlinks not supported")
+
+        monkeypatch.setattr("pathlib.Path.symlink_to", no_symlinks)
+
+        result = LoraResolution._find_and_link_file(download_path, "style.safetensors", cache_path)
+
+        assert os.path.samefile(result, source)
+        assert not Path(result).is_symlink()
+
+
 class TestLoraResolutionError:
     @pytest.mark.fast
     def test_nonexistent_file_raises(self):
@@ -240,6 +344,33 @@ class TestLoraResolutionTildeExpansion:
         assert result == str(lora_file)
 
 
+class TestLoraResolutionCollectionCache:
+    @pytest.mark.fast
+    @patch("huggingface_hub.snapshot_download")
+    def test_existing_mflux_cache_file_skips_hf_cache(self, mock_download, tmp_path, monkeypatch):
+        monkeypatch.setattr("mflux.models.common.resolution.lora_resolution.MFLUX_LORA_CACHE_DIR", tmp_path)
+        (tmp_path / "style.safetensors").write_bytes(b"x")
+
+        result = LoraResolution._load_collection_from_cache("org/collection", "style.safetensors")
+
+        assert result == str(tmp_path / "style.safetensors")
+        mock_download.assert_not_called()
+
+    @pytest.mark.fast
+    @patch("huggingface_hub.snapshot_download")
+    def test_dangling_mflux_cache_link_falls_back_to_hf_cache(self, mock_download, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        monkeypatch.setattr("mflux.models.common.resolution.lora_resolution.MFLUX_LORA_CACHE_DIR", cache_dir)
+        (cache_dir / "style.safetensors").symlink_to(tmp_path / "gone.safetensors")
+        mock_download.side_effect = LocalEntryNotFoundError("Not cached")
+
+        with pytest.raises(LocalEntryNotFoundError):
+            LoraResolution._load_collection_from_cache("org/collection", "style.safetensors")
+
+        assert mock_download.call_args.kwargs["local_files_only"] is True
+
+
 class TestLoraResolutionRelativePaths:
     @pytest.mark.fast
     def test_relative_path_not_treated_as_huggingface(self):
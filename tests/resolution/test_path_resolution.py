@@ -74,7 +74,7 @@ class TestPathResolutionLocal:
 
 class TestPathResolutionHuggingFace:
     @pytest.mark.fast
-    @patch("mflux.models.common.resolution.path_resolution.snapshot_download")
+    @patch("huggingface_hub.snapshot_download")
     def test_huggingface_format_downloads_when_not_cached(self, mock_download, tmp_path):
         # No cache exists, so snapshot_download is called once to download
         mock_download.return_value = str(tmp_path / "cached")
@@ -101,7 +101,7 @@ class TestPathResolutionHuggingFace:
         assert result == repo_cache
 
     @pytest.mark.fast
-    @patch("mflux.models.common.resolution.path_resolution.snapshot_download")
+    @patch("huggingface_hub.snapshot_download")
     def test_huggingface_passes_patterns(self, mock_download, tmp_path):
         mock_download.return_value = str(tmp_path / "cached")
 
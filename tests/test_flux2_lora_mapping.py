@@ -1,3 +1,7 @@
+import mlx.core as mx
+import mlx.nn as nn
+
+from mflux.models.common.lora.layer.linear_lora_layer import LoRALinear
 from mflux.models.common.lora.mapping.lora_loader import LoRALoader
 from mflux.models.flux2.weights.flux2_lora_mapping import Flux2LoRAMapping
 
@@ -69,6 +73,41 @@ class TestFlux2LoRAMapping:
 
         assert self._matched_keys(keys) == set(keys)
 
+    def test_pattern_index_matches_linear_pattern_scan(self):
+        pattern_mappings = LoRALoader._build_pattern_mappings(Flux2LoRAMapping.get_mapping())
+        pattern_index = LoRALoader._build_pattern_index(pattern_mappings)
+        keys = [
+            "transformer_blocks.0.attn.to_out.0.lora_A.default.weight",
+            "transformer_blocks.10.attn.to_q.lora_B.default.weight",
+            "diffusion_model.double_blocks.2.img_mlp.2.lora_A.weight",
+            "diffusion_model.single_blocks.0.linear1.lora_B.weight",
+            "diffusion_model.single_blocks.19.linear2.alpha",
+            "unrelated.module.7.weight",
+        ]
+
+        for key in keys:
+            scanned = [
+                (mapping, block_idx)
+                for mapping in pattern_mappings
+                if (block_idx := LoRALoader._match_pattern(key, mapping.source_pattern)) is not None
+            ]
+            assert LoRALoader._find_matching_mappings(key, pattern_index) == scanned
+
+    def test_applies_lora_to_nested_target_in_place(self):
+        class Block(nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.layers = [nn.Linear(4, 4), nn.Linear(4, 4)]
+
+        block = Block()
+        lora_data = {"lora_A": mx.zeros((4, 2)), "lora_B": mx.zeros((2, 4))}
+
+        applied = LoRALoader._apply_lora_matrices_to_target(block, "layers.1", lora_data, 1.0, role=None)
+
+        assert applied
+        assert isinstance(block.layers[1], LoRALinear)
+        assert not isinstance(block.layers[0], LoRALinear)
+
     def _matched_keys(self, keys: list[str]) -> set[str]:
         matched_keys: set[str] = set()
 
@@ -87,3 +126,46 @@ class TestFlux2LoRAMapping:
                     break
 
         return matched_keys
+
+    def test_load_and_apply_lora_reuses_prebuilt_pattern_mappings(self, tmp_path, monkeypatch):
+        lora_file = tmp_path / "adapter.safetensors"
+        mx.save_safetensors(str(lora_file), {"unused.lora_A.weight": mx.zeros((1, 1))})
+        pattern_mappings = LoRALoader._build_pattern_mappings(Flux2LoRAMapping.get_mapping())
+        seen = []
+
+        def fail_build(_targets):
+            raise AssertionError("pattern mappings should not be rebuilt")
+
+        monkeypatch.setattr(LoRALoader, "_build_pattern_mappings", staticmethod(fail_build))
+        monkeypatch.setattr(
+            LoRALoader,
+            "_apply_single_lora",
+            staticmethod(lambda _transformer, _file, _scale, mappings, *, role: seen.append(mappings)),
+        )
+
+        LoRALoader.load_and_apply_lora(
+            lora_mapping=Flux2LoRAMapping.get_mapping(),
+            transformer=nn.Module(),
+            lora_paths=[str(lora_file)],
+            lora_scales=[1.0],
+            pattern_mappings=pattern_mappings,
+        )
+
+        assert seen == [pattern_mappings]
+        assert seen[0] is pattern_mappings
+
+    def test_unmatched_key_report_lists_first_five_sorted(self, tmp_path, capsys):
+        lora_file = tmp_path / "adapter.safetensors"
+        names = [f"unused_{i}.lora_A.weight" for i in (7, 3, 9, 1, 5, 8, 2)]
+        mx.save_safetensors(str(lora_file), {name: mx.zeros((1, 1)) for name in names})
+
+        LoRALoader._apply_single_lora(
+            nn.Module(),
+            str(lora_file),
+            1.0,
+            LoRALoader._build_pattern_mappings(Flux2LoRAMapping.get_mapping()),
+            role=None,
+        )
+
+        listed = [line.strip()[2:] for line in capsys.readouterr().out.splitlines() if line.strip().startswith("- ")]
+        assert listed == sorted(names)[:5]
@@ -0,0 +1,26 @@
+import pytest
+
+from mflux.models.qwen.variants.edit.qwen_prompt_rewriter import QwenPromptRewriter
+
+
+@pytest.mark.fast
+def test_detects_chinese_prompts():
+    assert QwenPromptRewriter.detect_language("把猫变成狗") == "zh"
+    assert QwenPromptRewriter.detect_language("turn the cat into a dog") == "en"
+
+
+@pytest.mark.fast
+def test_english_terms_match_case_insensitively():
+    enhanced = QwenPromptRewriter.enhance_edit_prompt("CHANGE the sky to Watercolor, Ultra HD, KEEP the trees")
+
+    assert enhanced == (
+        "CHANGE the sky to Watercolor, Ultra HD, KEEP the trees, consistent artistic style throughout"
+        ", preserve fine details"
+    )
+
+
+@pytest.mark.fast
+def test_chinese_edit_prompt_gets_quality_and_preservation_hints():
+    enhanced = QwenPromptRewriter.enhance_edit_prompt("把猫变成狗")
+
+    assert enhanced == "把猫变成狗，超清，4K，电影级构图，高质量，精细，保持原有构图和光线，保持细节准确"
@@ -69,3 +69,11 @@ def test_disk_backed_data_loads_items(tmp_path: Path):
     assert ex.height == 256
     assert tuple(ex.clean_latents.shape) == (1, 7, 8)
     assert tuple(ex.cond.shape) == (10, 2560)
+
+
+@pytest.mark.fast
+def test_load_tensors_reports_missing_cache_item(tmp_path: Path):
+    paths = TrainingDataCache.wipe_and_init(data_root=tmp_path)
+
+    with pytest.raises(FileNotFoundError, match="Cached data item not found"):
+        TrainingDataCache.load_tensors(paths=paths, data_id=3)
@@ -1,6 +1,10 @@
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+from PIL import Image, UnidentifiedImageError
+
 from mflux.models.common.training.runner import TrainingRunner
 from mflux.models.common.training.state.training_spec import TrainingSpec
 
@@ -12,8 +16,7 @@ class TestDimensionResolution:
         mock_spec.max_resolution = None
 
         with patch("PIL.Image.open") as mock_open:
-            mock_img = MagicMock()
-            mock_img.size = (800, 600)
+            mock_img = SimpleNamespace(size=(800, 600))
             mock_open.return_value.__enter__.return_value = mock_img
 
             # When: Resolving dimensions
@@ -33,8 +36,7 @@ class TestDimensionResolution:
         mock_spec.max_resolution = None
 
         with patch("PIL.Image.open") as mock_open:
-            mock_img = MagicMock()
-            mock_img.size = (2000, 1000)
+            mock_img = SimpleNamespace(size=(2000, 1000))
             mock_open.return_value.__enter__.return_value = mock_img
 
             # When: Resolving dimensions
@@ -54,8 +56,7 @@ class TestDimensionResolution:
         mock_spec.max_resolution = None
 
         with patch("PIL.Image.open") as mock_open:
-            mock_img = MagicMock()
-            mock_img.size = (1000, 2000)
+            mock_img = SimpleNamespace(size=(1000, 2000))
             mock_open.return_value.__enter__.return_value = mock_img
 
             # When: Resolving dimensions
@@ -68,3 +69,35 @@ class TestDimensionResolution:
             # 2000 -> 2000
             assert width == 992
             assert height == 2000
+
+    def test_all_data_dimensions_keep_dataset_order(self, tmp_path):
+        # Given: Several images of different sizes
+        sizes = [(800, 600), (512, 512), (1000, 2000), (640, 480)]
+        data = []
+        for i, size in enumerate(sizes):
+            path = tmp_path / f"{i:02d}.png"
+            Image.new("RGB", size).save(path)
+            data.append(SimpleNamespace(image=path, input_image=None))
+        mock_spec = MagicMock(spec=TrainingSpec)
+        mock_spec.max_resolution = None
+        mock_spec.data = data
+
+        # When: Resolving all dimensions concurrently
+        dimensions = TrainingRunner._resolve_all_data_dimensions(mock_spec)
+
+        # Then: Results line up with the dataset order
+        assert dimensions == [(800, 592), (512, 512), (992, 2000), (640, 480)]
+
+    def test_all_data_dimensions_reject_unreadable_input_image(self, tmp_path):
+        # Given: An edit pair whose input image is not a readable image
+        image_path = tmp_path / "01.png"
+        Image.new("RGB", (512, 512)).save(image_path)
+        input_path = tmp_path / "01_in.png"
+        input_path.write_bytes(b"not an image")
+        mock_spec = MagicMock(spec=TrainingSpec)
+        mock_spec.max_resolution = None
+        mock_spec.data = [SimpleNamespace(image=image_path, input_image=input_path)]
+
+        # When/Then: Probing fails before any encoding would start
+        with pytest.raises(UnidentifiedImageError):
+            TrainingRunner._resolve_all_data_dimensions(mock_spec)
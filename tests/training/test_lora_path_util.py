@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+
+import pytest
+
+from mflux.models.common.training.lora.path_util import _iter_parts, get_at_path, set_at_path
+
+
+class TestLoraPathUtil:
+    @pytest.mark.fast
+    def test_get_and_set_walk_attributes_indices_and_dicts(self):
+        root = SimpleNamespace(blocks=[SimpleNamespace(attn={"to_q": "q"})])
+
+        assert get_at_path(root, "blocks.0.attn.to_q") == "q"
+        set_at_path(root, "blocks.0.attn.to_q", "lora_q")
+        assert root.blocks[0].attn["to_q"] == "lora_q"
+
+    @pytest.mark.fast
+    def test_parsed_paths_are_cached_and_immutable(self):
+        first = _iter_parts("blocks.0.attn.to_q")
+
+        assert first == ("blocks", "0", "attn", "to_q")
+        assert _iter_parts("blocks.0.attn.to_q") is first
+
+    @pytest.mark.fast
+    def test_empty_path_is_rejected(self):
+        with pytest.raises(ValueError, match="module_path cannot be empty"):
+            get_at_path(object(), "..")
@@ -0,0 +1,79 @@
+import json
+import random
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from mflux.models.common.training.statistics.plotter import Plotter
+
+
+class TestLossPlotter:
+    @pytest.mark.fast
+    def test_update_loss_plot_links_existing_preview_images(self, tmp_path, monkeypatch):
+        preview_dir = tmp_path / "preview"
+        preview_dir.mkdir()
+        (preview_dir / "0000000_preview_image_cat.png").touch()
+        (preview_dir / "0000020_preview_image_cat.png").touch()
+        plot_path = tmp_path / "loss.html"
+        training_spec = SimpleNamespace(
+            checkpoint=SimpleNamespace(output_path=str(tmp_path)),
+            monitoring=SimpleNamespace(smooth_loss=False, smooth_loss_window=5, preview_prompt_names=["cat"]),
+        )
+        training_state = SimpleNamespace(
+            statistics=SimpleNamespace(steps=[10, 20], losses=[0.5, 0.4]),
+            iterator=SimpleNamespace(total_number_of_steps=lambda: 100),
+            get_current_loss_plot_path=lambda _spec: plot_path,
+        )
+        monkeypatch.setattr(Plotter, "_build_html", staticmethod(json.dumps))
+
+        Plotter.update_loss_plot(training_spec=training_spec, training_state=training_state)
+
+        data = json.loads(plot_path.read_text(encoding="utf-8"))
+        assert data["previewMap"] == {
+            "20": "../preview/0000020_preview_image_cat.png",
+            "0": "../preview/0000000_preview_image_cat.png",
+        }
+        assert data["previewSteps"] == [0, 20]
+        assert data["lossByStep"] == {"10": 0.5, "20": 0.4}
+
+    @pytest.mark.fast
+    def test_update_loss_plot_lists_preview_directory_once(self, tmp_path, monkeypatch):
+        plot_path = tmp_path / "loss.html"
+        training_spec = SimpleNamespace(checkpoint=SimpleNamespace(output_path=str(tmp_path)), monitoring=None)
+        training_state = SimpleNamespace(
+            statistics=SimpleNamespace(steps=list(range(0, 500, 10)), losses=[0.5] * 50),
+            iterator=SimpleNamespace(total_number_of_steps=lambda: 500),
+            get_current_loss_plot_path=lambda _spec: plot_path,
+        )
+        monkeypatch.setattr(Plotter, "_build_html", staticmethod(json.dumps))
+        monkeypatch.setattr(Path, "exists", lambda _self: pytest.fail("per-step exists() probe"))
+
+        Plotter.update_loss_plot(training_spec=training_spec, training_state=training_state)
+
+        data = json.loads(plot_path.read_text(encoding="utf-8"))
+        assert data["previewMap"] == {}
+        assert data["previewSteps"] == []
+
+    @pytest.mark.fast
+    def test_smooth_losses_matches_trailing_window_mean(self):
+        rng = random.Random(0)
+        values = [rng.uniform(0.0, 1.0) for _ in range(50)]
+        window = 5
+
+        smoothed = Plotter._smooth_losses(values, window)
+
+        expected = [
+            sum(values[max(0, i - window + 1) : i + 1]) / len(values[max(0, i - window + 1) : i + 1])
+            for i in range(len(values))
+        ]
+        assert smoothed == pytest.approx(expected)
+
+    @pytest.mark.fast
+    def test_smooth_losses_with_window_of_one_returns_copy(self):
+        values = [0.3, 0.2]
+
+        smoothed = Plotter._smooth_losses(values, 1)
+
+        assert smoothed == values
+        assert smoothed is not values
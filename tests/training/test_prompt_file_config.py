@@ -1,8 +1,9 @@
+import re
 from pathlib import Path
 
 import pytest
 
-from mflux.models.common.training.state.training_spec import TrainingSpec
+from mflux.models.common.training.state.training_spec import MonitoringSpec, TrainingSpec
 
 
 @pytest.mark.fast
@@ -76,6 +77,36 @@ def test_data_images_omitted_discovers_images_and_uses_matching_txt(tmp_path: Pa
     assert [e.prompt for e in spec.data] == ["one", "two"]
 
 
+@pytest.mark.fast
+def test_data_discovery_skips_directories_and_matches_suffix_case_insensitively(tmp_path: Path):
+    data_dir = tmp_path / "data"
+    (data_dir / "folder.png").mkdir(parents=True)
+    (data_dir / "01.JPG").write_bytes(b"")
+    (data_dir / "01.txt").write_text("one\n", encoding="utf-8")
+    (data_dir / "notes.md").write_text("not an image\n", encoding="utf-8")
+
+    data = TrainingSpec._discover_data(data_path="data", base_path=tmp_path / "train.json")
+
+    assert [e.image.name for e in data] == ["01.JPG"]
+
+
+@pytest.mark.fast
+def test_data_discovery_checks_prompt_files_against_one_listing(tmp_path: Path, monkeypatch):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for name in ("01", "02", "03"):
+        (data_dir / f"{name}.png").write_bytes(b"")
+        (data_dir / f"{name}.txt").write_text(name, encoding="utf-8")
+    probed = []
+    original_exists = Path.exists
+    monkeypatch.setattr(Path, "exists", lambda self: probed.append(self) or original_exists(self))
+
+    data = TrainingSpec._discover_data(data_path=str(data_dir), base_path=None)
+
+    assert [e.prompt for e in data] == ["01", "02", "03"]
+    assert not [p for p in probed if p.suffix == ".txt"]
+
+
 @pytest.mark.fast
 def test_data_images_omitted_missing_prompt_file_raises(tmp_path: Path):
     data_dir = tmp_path / "data"
@@ -311,6 +342,35 @@ def test_validation_prompt_is_rejected(tmp_path: Path):
         TrainingSpec.from_conf(conf, str(tmp_path / "train.json"), new_folder=False)
 
 
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    ("key", "replacement"),
+    [
+        ("validation_prompt_file", "data/preview*.txt"),
+        ("validation_image", "data/preview.*"),
+        ("preview_prompt", "data/preview*.txt"),
+        ("preview_prompt_file", "data/preview*.txt"),
+        ("preview_image", "data/preview.*"),
+        ("validation_width", "preview_width"),
+        ("validation_height", "preview_height"),
+    ],
+)
+def test_removed_monitoring_keys_point_at_their_replacement(key: str, replacement: str):
+    param = {"plot_frequency": 1, "generate_image_frequency": 1, key: "x"}
+
+    with pytest.raises(ValueError, match=re.escape(replacement)):
+        MonitoringSpec.create(param, preview_prompts=["a"], preview_prompt_names=["preview"])
+
+
+@pytest.mark.fast
+def test_removed_monitoring_keys_set_to_null_are_ignored():
+    param = {"plot_frequency": 1, "generate_image_frequency": 1, "validation_prompt": None, "preview_image": None}
+
+    spec = MonitoringSpec.create(param, preview_prompts=["a"], preview_prompt_names=["preview"])
+
+    assert spec.preview_prompts == ["a"]
+
+
 @pytest.mark.fast
 def test_preview_prompt_file_defaults_to_data(tmp_path: Path):
     data_dir = tmp_path / "data"
@@ -469,3 +529,54 @@ def test_validation_prompt_file_is_rejected(tmp_path: Path):
 
     with pytest.raises(ValueError, match="validation_prompt_file"):
         TrainingSpec.from_conf(conf, str(tmp_path / "train.json"), new_folder=False)
+
+
+@pytest.mark.fast
+def test_invalid_config_does_not_create_output_folder(tmp_path: Path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    (data_dir / "01.jpeg").write_bytes(b"")
+    (data_dir / "01.txt").write_text("one\n", encoding="utf-8")
+
+    conf = {
+        "model": "dev",
+        "seed": 42,
+        "steps": 20,
+        "training_loop": {"num_epochs": 1, "batch_size": 1},
+        "optimizer": {"name": "AdamW", "learning_rate": 1e-4},
+        "checkpoint": {"output_path": str(tmp_path / "out"), "save_frequency": 10},
+        "lora_layers": {},
+        "data": "data",
+    }
+
+    with pytest.raises(ValueError, match="lora_layers.targets"):
+        TrainingSpec.from_conf(conf, str(tmp_path / "train.json"), new_folder=True)
+
+    assert not (tmp_path / "out").exists()
+
+
+@pytest.mark.fast
+def test_find_missing_files_only_reports_unlisted_names(tmp_path: Path):
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+
+    missing = TrainingSpec._find_missing_files(tmp_path, ["a.txt", "b.txt", "c.txt", "c.txt"], {"a.txt"})
+
+    assert missing == {"c.txt"}
+
+
+@pytest.mark.fast
+def test_invalid_config_fields_fail_before_data_discovery(tmp_path: Path):
+    conf = {
+        "model": "dev",
+        "seed": 42,
+        "steps": 20,
+        "training_loop": {"num_epochs": 1, "batch_size": 1},
+        "optimizer": {"name": "AdamW", "learning_rate": 1e-4},
+        "checkpoint": {"output_path": str(tmp_path / "out"), "save_frequency": 0},
+        "lora_layers": {"targets": []},
+        "data": "missing_data_dir",
+    }
+
+    with pytest.raises(ValueError, match="save_frequency must be > 0"):
+        TrainingSpec.from_conf(conf, str(tmp_path / "train.json"), new_folder=False)
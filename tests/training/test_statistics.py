@@ -0,0 +1,22 @@
+import json
+
+import pytest
+
+from mflux.models.common.training.statistics.statistics import Statistics
+
+
+class TestStatistics:
+    @pytest.mark.fast
+    def test_save_writes_compact_loss_history(self, tmp_path):
+        stats = Statistics()
+        stats.append_values(step=1, loss=0.5)
+        stats.append_values(step=2, loss=0.25)
+        path = tmp_path / "loss.json"
+
+        stats.save(path)
+
+        text = path.read_text(encoding="utf-8")
+        assert "\n" not in text
+        entries = json.loads(text)
+        assert [entry["step"] for entry in entries] == [1, 2]
+        assert [entry["loss"] for entry in entries] == [0.5, 0.25]
@@ -1,6 +1,11 @@
+import random
 from types import SimpleNamespace
 
-from mflux.models.common.training.trainer import TrainingTrainer
+import mlx.core as mx
+import pytest
+from PIL import Image
+
+from mflux.models.common.training.trainer import TrainingTrainer, _squared_residual
 
 
 class _DummyOptimizer:
@@ -12,6 +17,39 @@ class _DummyOptimizer:
         self.saved_paths.append(path)
 
 
+class _LossAdapter:
+    def __init__(self, *, scheduler, precision):
+        self.scheduler = scheduler
+        self.precision = precision
+        self.created_sizes = []
+        self.timesteps = []
+        self.noised_latents = []
+
+    def create_config(self, _training_spec, *, width, height):
+        self.created_sizes.append((width, height))
+        return SimpleNamespace(
+            model_config=SimpleNamespace(requires_sigma_shift=False),
+            num_inference_steps=4,
+            precision=self.precision,
+            scheduler=self.scheduler,
+        )
+
+    def predict_noise(self, *, t, latents_t, sigmas, cond, config):
+        self.timesteps.append(t)
+        self.noised_latents.append(latents_t)
+        return mx.zeros_like(latents_t)
+
+
+def _loss_fixture(*, precision=mx.float32, timestep_low=0, timestep_high=None):
+    scheduler = SimpleNamespace(sigmas=mx.linspace(1.0, 0.0, 5))
+    adapter = _LossAdapter(scheduler=scheduler, precision=precision)
+    training_spec = SimpleNamespace(
+        training_loop=SimpleNamespace(timestep_low=timestep_low, timestep_high=timestep_high)
+    )
+    base_config = SimpleNamespace(scheduler=scheduler, image_seq_len=4)
+    return adapter, training_spec, base_config
+
+
 class TestTrainingTrainer:
     def test_generate_previews_with_optimizer_offload_low_ram(self, monkeypatch):
         dummy_optimizer = _DummyOptimizer(state=["original_state"])
@@ -74,3 +112,117 @@ class TestTrainingTrainer:
         assert dummy_optimizer.optimizer.state == ["restored", [("k", "v")]]
         assert len(clear_cache_calls) == 2
         assert len(gc_calls) == 2
+
+    def test_preview_dimensions_read_each_preview_image_once(self, tmp_path, monkeypatch):
+        preview = tmp_path / "preview.png"
+        Image.new("RGB", (64, 48)).save(preview)
+        training_spec = SimpleNamespace(monitoring=SimpleNamespace())
+        monkeypatch.setattr(TrainingTrainer, "_preview_image_sizes", {})
+
+        opened = []
+        real_open = Image.open
+        monkeypatch.setattr(
+            "mflux.models.common.training.trainer.PILImage.open",
+            lambda path: opened.append(path) or real_open(path),
+        )
+
+        first = TrainingTrainer._preview_dimensions(training_spec, preview_image=preview)
+        second = TrainingTrainer._preview_dimensions(training_spec, preview_image=preview)
+
+        assert first == second == (64, 48)
+        assert opened == [preview]
+
+    def test_generate_previews_writes_every_preview_before_returning(self, tmp_path):
+        training_spec = SimpleNamespace(
+            is_edit=False,
+            seed=1,
+            steps=2,
+            monitoring=SimpleNamespace(
+                preview_prompts=["first", "second"],
+                preview_prompt_names=["a", "b"],
+                preview_images=[],
+                preview_width=32,
+                preview_height=32,
+            ),
+        )
+        adapter = SimpleNamespace(
+            generate_preview_image=lambda **kwargs: Image.new("RGB", (kwargs["width"], kwargs["height"]))
+        )
+        training_state = SimpleNamespace(
+            get_current_preview_image_path=lambda _spec, preview_index, preview_name: (
+                tmp_path / f"{preview_index}_{preview_name}.png"
+            )
+        )
+
+        TrainingTrainer._generate_previews(adapter, training_spec, training_state)
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["0_a.png", "1_b.png"]
+        with Image.open(tmp_path / "1_b.png") as img:
+            assert img.size == (32, 32)
+
+    def test_compute_loss_builds_one_config_per_item_size(self):
+        adapter, training_spec, base_config = _loss_fixture()
+        items = [
+            SimpleNamespace(width=w, height=h, clean_latents=mx.ones((1, 4, 8)), cond=None)
+            for w, h in [(512, 512), (512, 768), (512, 512)]
+        ]
+        config_cache = {}
+
+        for seed in range(2):
+            batch = SimpleNamespace(data=items, rng=random.Random(seed))
+            TrainingTrainer.compute_loss(adapter, training_spec, base_config, batch, config_cache)
+
+        assert adapter.created_sizes == [(512, 512), (512, 768)]
+
+    def test_timesteps_are_sampled_on_the_host_within_the_configured_range(self, monkeypatch):
+        monkeypatch.setattr(mx.random, "randint", lambda *args, **kwargs: pytest.fail("device-side timestep sampling"))
+        adapter, training_spec, base_config = _loss_fixture(timestep_low=1, timestep_high=3)
+        items = [SimpleNamespace(width=64, height=64, clean_latents=mx.ones((1, 4, 8)), cond=None)] * 20
+
+        TrainingTrainer.compute_loss(
+            adapter, training_spec, base_config, SimpleNamespace(data=items, rng=random.Random(0))
+        )
+
+        assert all(isinstance(t, int) and 1 <= t < 3 for t in adapter.timesteps)
+        assert set(adapter.timesteps) == {1, 2}
+
+    def test_loss_is_reduced_in_float32_for_half_precision_latents(self):
+        adapter, training_spec, base_config = _loss_fixture(precision=mx.float16)
+        items = [SimpleNamespace(width=64, height=64, clean_latents=mx.ones((1, 64, 64), dtype=mx.float16), cond=None)]
+
+        loss = TrainingTrainer.compute_loss(
+            adapter, training_spec, base_config, SimpleNamespace(data=items, rng=random.Random(0))
+        )
+
+        assert loss.dtype == mx.float32
+        assert loss.shape == ()
+
+    def test_batch_noise_keys_are_independent_and_reproducible(self):
+        adapter, training_spec, base_config = _loss_fixture(timestep_high=1)
+        items = [SimpleNamespace(width=64, height=64, clean_latents=mx.zeros((1, 4, 8)), cond=None)] * 2
+
+        for _ in range(2):
+            batch = SimpleNamespace(data=items, rng=random.Random(7))
+            TrainingTrainer.compute_loss(adapter, training_spec, base_config, batch)
+
+        first_run, second_run = adapter.noised_latents[:2], adapter.noised_latents[2:]
+        assert not mx.array_equal(first_run[0], first_run[1])
+        assert all(mx.array_equal(a, b) for a, b in zip(first_run, second_run))
+
+    def test_fused_squared_residual_matches_unfused_form_across_shapes(self):
+        for shape in [(1, 4, 8), (2, 3, 5, 7)]:
+            clean, predicted, noise = (mx.random.normal(shape).astype(mx.bfloat16) for _ in range(3))
+            expected = (clean + predicted - noise).astype(mx.float32).square()
+
+            fused = _squared_residual(clean, predicted, noise)
+
+            assert fused.dtype == mx.float32
+            assert fused.shape == shape
+            assert mx.allclose(fused, expected).item()
+
+    def test_progress_redraws_are_throttled_when_stderr_is_not_a_terminal(self, monkeypatch):
+        monkeypatch.setattr("sys.stderr", SimpleNamespace(isatty=lambda: False))
+        assert TrainingTrainer._progress_interval() == TrainingTrainer.NON_TTY_PROGRESS_INTERVAL_SECONDS
+
+        monkeypatch.setattr("sys.stderr", SimpleNamespace(isatty=lambda: True))
+        assert TrainingTrainer._progress_interval() == 0.1
@@ -0,0 +1,29 @@
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from mflux.models.common.training.state.zip_util import ZipUtil
+
+
+@pytest.mark.fast
+def test_read_json_matches_unzip_with_json_loader(tmp_path: Path):
+    zip_path = tmp_path / "0000010_checkpoint.zip"
+    payload = {"files": {"config": "0000010_config.json"}, "step": 10}
+    with zipfile.ZipFile(zip_path, "w") as zipf:
+        zipf.writestr("nested/checkpoint.json", json.dumps(payload))
+
+    via_temp_file = ZipUtil.unzip(zip_path, "checkpoint.json", lambda x: json.loads(Path(x).read_text()))
+
+    assert ZipUtil.read_json(zip_path, "checkpoint.json") == via_temp_file == payload
+
+
+@pytest.mark.fast
+def test_read_json_missing_member_raises(tmp_path: Path):
+    zip_path = tmp_path / "checkpoint.zip"
+    with zipfile.ZipFile(zip_path, "w") as zipf:
+        zipf.writestr("checkpoint.json", "{}")
+
+    with pytest.raises(FileNotFoundError):
+        ZipUtil.read_json(zip_path, "run.json")
@@ -31,3 +31,23 @@ def test_is_m1_or_m2_false_outside_darwin(monkeypatch):
     monkeypatch.setattr(AppleSiliconUtil, "_get_chip_name", lambda: "Apple M2")
 
     assert AppleSiliconUtil.is_m1_or_m2() is False
+
+
+def test_chip_name_is_read_without_subprocess_when_sysctlbyname_works(monkeypatch):
+    monkeypatch.setattr(AppleSiliconUtil, "_chip_name", None)
+    monkeypatch.setattr(AppleSiliconUtil, "read_sysctl_string", staticmethod(lambda name: "Apple M1"))
+
+    def fail_subprocess(name):
+        raise AssertionError("subprocess fallback should not run")
+
+    monkeypatch.setattr(AppleSiliconUtil, "_read_sysctl_string_via_subprocess", staticmethod(fail_subprocess))
+
+    assert AppleSiliconUtil._get_chip_name() == "Apple M1"
+
+
+def test_chip_name_falls_back_to_subprocess(monkeypatch):
+    monkeypatch.setattr(AppleSiliconUtil, "_chip_name", None)
+    monkeypatch.setattr(AppleSiliconUtil, "read_sysctl_string", staticmethod(lambda name: None))
+    monkeypatch.setattr(AppleSiliconUtil, "_read_sysctl_string_via_subprocess", staticmethod(lambda name: "Apple M2"))
+
+    assert AppleSiliconUtil._get_chip_name() == "Apple M2"
@@ -0,0 +1,14 @@
+import pytest
+
+from mflux.utils.box_values import BoxValueError, BoxValues
+
+
+@pytest.mark.fast
+def test_parse_mixes_percentages_and_ints():
+    assert BoxValues.parse(" 10%, 50 , 20% ") == BoxValues("10%", 50, "20%", 50)
+
+
+@pytest.mark.fast
+def test_parse_rejects_non_numeric_parts():
+    with pytest.raises(BoxValueError, match="Invalid padding value: 10px"):
+        BoxValues.parse("10px,20")
@@ -0,0 +1,22 @@
+import pytest
+
+from mflux.utils.lora_library_util import LoraLibraryUtil
+
+
+@pytest.mark.fast
+def test_list_loras_counts_files_per_library_path(tmp_path, capsys):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    (first / "nested").mkdir(parents=True)
+    second.mkdir()
+    (first / "a.safetensors").touch()
+    (first / "nested" / "b.safetensors").touch()
+    (second / "c.safetensors").touch()
+
+    assert LoraLibraryUtil.list_loras([str(first), str(second)]) == 0
+
+    output = capsys.readouterr().out
+    assert f"a -> {(first / 'a.safetensors').resolve()}\n" in output
+    assert "Total LoRA files found: 3" in output
+    assert f"{first}: 2 files" in output
+    assert f"{second}: 1 files" in output